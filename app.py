@@ -1,13 +1,13 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import json
+import heapq
+import io
 import os
-from typing import Dict, List, Optional
+from typing import Dict, List, Tuple
 import uuid
 
+import clock
 from data_manager import DataManager
 from business_matcher import BusinessMatcher
 from connection_manager import ConnectionManager
@@ -34,7 +34,29 @@ if 'show_delete_confirmation' not in st.session_state:
     st.session_state.show_delete_confirmation = False
 if 'company_to_delete' not in st.session_state:
     st.session_state.company_to_delete = None
+if 'matcher_version' not in st.session_state:
+    st.session_state.matcher_version = st.session_state.data_manager.version
+if 'analytics_figures' not in st.session_state:
+    st.session_state.analytics_figures = {}
+if 'analytics_counts' not in st.session_state:
+    st.session_state.analytics_counts = {}
 
+# Derived data below is memoized in session_state and keyed on DataManager.version, which the
+# session's DataManager bumps on every committed write, so there is no separate counter to bump
+
+def _current_matcher() -> BusinessMatcher:
+    """The session's matcher, with its caches dropped if the data changed since it last ran."""
+    version = st.session_state.data_manager.version
+    if st.session_state.matcher_version != version:
+        st.session_state.business_matcher.invalidate()
+        st.session_state.matcher_version = version
+    return st.session_state.business_matcher
+
+def _company_names() -> Tuple[str, ...]:
+    """Company names in insertion order, for the company pickers."""
+    return tuple(c['name'] for c in st.session_state.data_manager.get_companies())
+
+@st.fragment
 def show_delete_confirmation_dialog():
     """Show confirmation dialog for company deletion."""
     company = st.session_state.company_to_delete
@@ -117,6 +139,49 @@ def show_delete_confirmation_dialog():
             
             st.markdown("---")
 
+# Sample connection scenarios:
+# (business need index, from, to, match score, status, created days ago, updated days ago, notes template)
+SAMPLE_CONNECTIONS = (
+    (0, 'TechStart Inc.', 'Top VC', 0.85, 'contacted', 5, 2,
+     "[{ts[5]}] High match score! Top VC specializes in tech startups seeking Series A.\n"
+     "[{ts[2]}] Sent initial pitch deck to their investment team. Waiting for response."),
+    (1, 'GreenEnergy Solutions', 'Amos Company', 0.72, 'responded', 7, 1,
+     "[{ts[7]}] Matched based on B2B SaaS expertise for energy sector.\n"
+     "[{ts[4]}] Initial contact made through LinkedIn.\n"
+     "[{ts[1]}] Great response! They're interested in exploring energy management software partnerships. Scheduling call for this week."),
+    (0, 'TechStart Inc.', 'Sivan Company', 0.68, 'connected', 14, 3,
+     "[{ts[14]}] Healthcare tech + AI marketing = interesting synergy for health/fitness customer acquisition.\n"
+     "[{ts[10]}] Excellent first call - they need better customer acquisition tools.\n"
+     "[{ts[7]}] Pilot program agreed! Testing our AI marketing platform for their fitness app.\n"
+     "[{ts[3]}] SUCCESS! Connection established - they became a paying customer and strategic partner."),
+    (1, 'GreenEnergy Solutions', 'FinanceFlow', 0.58, 'initiated', 0, 0,
+     "[{ts[0]}] New potential match identified. FinanceFlow's payment solutions could help our customers finance renewable energy installations. Researching their partnership program."),
+    (0, 'TechStart Inc.', 'Noa Company', 0.45, 'closed', 21, 12,
+     "[{ts[21]}] Explored potential B2C application of our B2B platform.\n"
+     "[{ts[18]}] Interesting discussions but different target markets.\n"
+     "[{ts[12]}] Decided not to pursue - focus mismatch between B2B and B2C. Maintaining friendly relationship for future opportunities."),
+)
+
+def _iter_sample_connections(business_needs: List[Dict]):
+    """Yield the sample connection records one at a time."""
+    # Capture the clock once so all sample records share the same "now"
+    now = clock.now()[0]
+    at = {days: now - timedelta(days=days) for days in (0, 1, 2, 3, 4, 5, 7, 10, 12, 14, 18, 21)}
+    ts = {days: stamp.strftime('%Y-%m-%d %H:%M') for days, stamp in at.items()}
+    
+    for need_idx, from_entity, to_entity, match_score, status, created_days, updated_days, notes in SAMPLE_CONNECTIONS:
+        yield {
+            'id': str(uuid.uuid4()),
+            'business_need_id': business_needs[need_idx]['id'] if len(business_needs) > need_idx else str(uuid.uuid4()),
+            'from_entity': from_entity,
+            'to_entity': to_entity,
+            'match_score': match_score,
+            'status': status,
+            'created_date': at[created_days].isoformat(),
+            'updated_date': at[updated_days].isoformat(),
+            'notes': notes.format(ts=ts)
+        }
+
 def create_sample_connections():
     """Create sample connections to demonstrate the Connection Management functionality."""
     # Get existing business needs
@@ -126,68 +191,8 @@ def create_sample_connections():
         st.error("Please load sample data first (Companies and Business Needs are required)")
         return False
     
-    # Sample connections with realistic scenarios
-    sample_connections = [
-        {
-            'id': str(uuid.uuid4()),
-            'business_need_id': business_needs[0]['id'] if len(business_needs) > 0 else str(uuid.uuid4()),
-            'from_entity': 'TechStart Inc.',
-            'to_entity': 'Top VC',
-            'match_score': 0.85,
-            'status': 'contacted',
-            'created_date': (datetime.now() - timedelta(days=5)).isoformat(),
-            'updated_date': (datetime.now() - timedelta(days=2)).isoformat(),
-            'notes': f"[{(datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d %H:%M')}] High match score! Top VC specializes in tech startups seeking Series A.\n[{(datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d %H:%M')}] Sent initial pitch deck to their investment team. Waiting for response."
-        },
-        {
-            'id': str(uuid.uuid4()),
-            'business_need_id': business_needs[1]['id'] if len(business_needs) > 1 else str(uuid.uuid4()),
-            'from_entity': 'GreenEnergy Solutions',
-            'to_entity': 'Amos Company',
-            'match_score': 0.72,
-            'status': 'responded',
-            'created_date': (datetime.now() - timedelta(days=7)).isoformat(),
-            'updated_date': (datetime.now() - timedelta(days=1)).isoformat(),
-            'notes': f"[{(datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d %H:%M')}] Matched based on B2B SaaS expertise for energy sector.\n[{(datetime.now() - timedelta(days=4)).strftime('%Y-%m-%d %H:%M')}] Initial contact made through LinkedIn.\n[{(datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M')}] Great response! They're interested in exploring energy management software partnerships. Scheduling call for this week."
-        },
-        {
-            'id': str(uuid.uuid4()),
-            'business_need_id': business_needs[0]['id'] if len(business_needs) > 0 else str(uuid.uuid4()),
-            'from_entity': 'TechStart Inc.',
-            'to_entity': 'Sivan Company',
-            'match_score': 0.68,
-            'status': 'connected',
-            'created_date': (datetime.now() - timedelta(days=14)).isoformat(),
-            'updated_date': (datetime.now() - timedelta(days=3)).isoformat(),
-            'notes': f"[{(datetime.now() - timedelta(days=14)).strftime('%Y-%m-%d %H:%M')}] Healthcare tech + AI marketing = interesting synergy for health/fitness customer acquisition.\n[{(datetime.now() - timedelta(days=10)).strftime('%Y-%m-%d %H:%M')}] Excellent first call - they need better customer acquisition tools.\n[{(datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d %H:%M')}] Pilot program agreed! Testing our AI marketing platform for their fitness app.\n[{(datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d %H:%M')}] SUCCESS! Connection established - they became a paying customer and strategic partner."
-        },
-        {
-            'id': str(uuid.uuid4()),
-            'business_need_id': business_needs[1]['id'] if len(business_needs) > 1 else str(uuid.uuid4()),
-            'from_entity': 'GreenEnergy Solutions',
-            'to_entity': 'FinanceFlow',
-            'match_score': 0.58,
-            'status': 'initiated',
-            'created_date': datetime.now().isoformat(),
-            'updated_date': datetime.now().isoformat(),
-            'notes': f"[{datetime.now().strftime('%Y-%m-%d %H:%M')}] New potential match identified. FinanceFlow's payment solutions could help our customers finance renewable energy installations. Researching their partnership program."
-        },
-        {
-            'id': str(uuid.uuid4()),
-            'business_need_id': business_needs[0]['id'] if len(business_needs) > 0 else str(uuid.uuid4()),
-            'from_entity': 'TechStart Inc.',
-            'to_entity': 'Noa Company',
-            'match_score': 0.45,
-            'status': 'closed',
-            'created_date': (datetime.now() - timedelta(days=21)).isoformat(),
-            'updated_date': (datetime.now() - timedelta(days=12)).isoformat(),
-            'notes': f"[{(datetime.now() - timedelta(days=21)).strftime('%Y-%m-%d %H:%M')}] Explored potential B2C application of our B2B platform.\n[{(datetime.now() - timedelta(days=18)).strftime('%Y-%m-%d %H:%M')}] Interesting discussions but different target markets.\n[{(datetime.now() - timedelta(days=12)).strftime('%Y-%m-%d %H:%M')}] Decided not to pursue - focus mismatch between B2B and B2C. Maintaining friendly relationship for future opportunities."
-        }
-    ]
-    
-    # Add connections to the database
-    for connection in sample_connections:
-        st.session_state.data_manager.add_connection(connection)
+    # Stream the records into the database with a single write
+    st.session_state.data_manager.add_connections_iter(_iter_sample_connections(business_needs))
     
     return True
 
@@ -222,27 +227,41 @@ def dashboard_page():
     
     col1, col2, col3, col4 = st.columns(4)
     
-    # Get current data
-    companies = st.session_state.data_manager.get_companies()
-    contacts = st.session_state.data_manager.get_contacts()
-    business_needs = st.session_state.data_manager.get_business_needs()
-    connections = st.session_state.data_manager.get_connections()
+    # DataManager keeps every table in memory, so these are reads of its lists
+    dm = st.session_state.data_manager
+    companies = dm.get_companies()
+    contacts = dm.get_contacts()
+    business_needs = dm.get_business_needs()
+    connections = dm.get_connections()
+    active_needs_count = sum(1 for n in business_needs if n['status'] == 'active')
     
     with col1:
         st.metric("Total Companies", len(companies))
     with col2:
         st.metric("Total Contacts", len(contacts))
     with col3:
-        st.metric("Active Business Needs", len([n for n in business_needs if n['status'] == 'active']))
+        st.metric("Active Business Needs", active_needs_count)
     with col4:
         st.metric("Total Connections", len(connections))
     
     # Recent activity
     st.subheader("Recent Activity")
     if connections:
-        recent_connections = sorted(connections, key=lambda x: x['created_date'], reverse=True)[:5]
-        for conn in recent_connections:
-            st.write(f"📞 {conn['from_entity']} → {conn['to_entity']} ({conn['status']})")
+        recent_connections = heapq.nlargest(5, connections, key=lambda x: x['created_date'])
+        recent_df = pd.DataFrame(recent_connections).reindex(
+            columns=['from_entity', 'to_entity', 'status', 'created_date']
+        )
+        st.dataframe(
+            recent_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'from_entity': "From",
+                'to_entity': "To",
+                'status': "Status",
+                'created_date': "Created"
+            }
+        )
     else:
         st.info("No recent connections found. Start by adding companies and creating business needs!")
     
@@ -265,6 +284,54 @@ def dashboard_page():
             st.session_state.quick_action = "find_matches"
             st.rerun()
 
+def add_company_form():
+    """Form for adding a company."""
+    with st.form("add_company_form"):
+        st.subheader("Add New Company")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            name = st.text_input("Company Name*", key="company_name")
+            sector = st.selectbox("Sector", [
+                "Technology", "Finance", "Healthcare", "Manufacturing", 
+                "Retail", "Education", "Real Estate", "Other"
+            ])
+            size = st.selectbox("Company Size", [
+                "1-10", "11-50", "51-200", "201-1000", "1000+"
+            ])
+            website = st.text_input("Website")
+        
+        with col2:
+            location = st.text_input("Location")
+            founded_year = st.number_input("Founded Year", min_value=1800, max_value=2024, value=2020)
+            description = st.text_area("Description")
+            tags = st.text_input("Tags (comma-separated)", help="e.g., startup, b2b, saas")
+        
+        submitted = st.form_submit_button("Add Company")
+        
+        if submitted and name:
+            company_data = {
+                'id': str(uuid.uuid4()),
+                'name': name,
+                'sector': sector,
+                'size': size,
+                'website': website,
+                'location': location,
+                'founded_year': founded_year,
+                'description': description,
+                'tags': [tag.strip() for tag in tags.split(',') if tag.strip()],
+                'created_date': clock.now_iso()
+            }
+            
+            # Log company creation
+            st.session_state.logger.log_company_creation(company_data, "Company created via web interface")
+            
+            # Add company to database
+            st.success(f"Company '{name}' added successfully!")
+            st.session_state.data_manager.add_company(company_data)
+            st.rerun()
+
 def companies_page():
     st.header("🏢 Companies Management")
     
@@ -277,13 +344,13 @@ def companies_page():
             # Dataframe in expander
             with st.expander("Companies"):
                 df = pd.DataFrame(companies)
-                st.table(df)
+                st.dataframe(df, use_container_width=True, hide_index=True)
             
             # Company selection and actions outside expander
-            selected_company_name = st.selectbox("Select company for details/actions", ["No Selection"] + [c['name'] for c in companies])
+            selected_company_name = st.selectbox("Select company for details/actions", ("No Selection",) + _company_names())
             
             if selected_company_name and selected_company_name != "No Selection":
-                company = next((c for c in companies if c['name'] == selected_company_name), None)
+                company = st.session_state.data_manager.get_company_by_name(selected_company_name)
                 if company:
                     # Display company details
                     st.subheader("Company Details")
@@ -316,19 +383,16 @@ def companies_page():
                     # Tags display
                     if company.get('tags'):
                         st.write("**🏷️ Tags:**")
-                        tag_cols = st.columns(min(len(company['tags']), 4))
-                        for i, tag in enumerate(company['tags']):
-                            with tag_cols[i % 4]:
-                                st.markdown(f"`{tag}`")
+                        st.markdown(" ".join(f"`{tag}`" for tag in company['tags']))
                     else:
                         st.write("**🏷️ Tags:** No tags")
                     
                     # Created date
                     if company.get('created_date'):
-                        try:
-                            created_date = datetime.fromisoformat(company['created_date'].replace('Z', '+00:00'))
+                        created_date = clock.parse_iso(company['created_date'])
+                        if created_date:
                             st.caption(f"Added to system: {created_date.strftime('%B %d, %Y at %H:%M')}")
-                        except:
+                        else:
                             st.caption(f"Added to system: {company['created_date']}")
                     
                     st.divider()
@@ -346,52 +410,48 @@ def companies_page():
             st.info("No companies found. Add your first company below!")
 
     with tab2:
-        with st.form("add_company_form"):
-            st.subheader("Add New Company")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                name = st.text_input("Company Name*", key="company_name")
-                sector = st.selectbox("Sector", [
-                    "Technology", "Finance", "Healthcare", "Manufacturing", 
-                    "Retail", "Education", "Real Estate", "Other"
-                ])
-                size = st.selectbox("Company Size", [
-                    "1-10", "11-50", "51-200", "201-1000", "1000+"
-                ])
-                website = st.text_input("Website")
-            
-            with col2:
-                location = st.text_input("Location")
-                founded_year = st.number_input("Founded Year", min_value=1800, max_value=2024, value=2020)
-                description = st.text_area("Description")
-                tags = st.text_input("Tags (comma-separated)", help="e.g., startup, b2b, saas")
-            
-            submitted = st.form_submit_button("Add Company")
-            
-            if submitted and name:
-                company_data = {
-                    'id': str(uuid.uuid4()),
-                    'name': name,
-                    'sector': sector,
-                    'size': size,
-                    'website': website,
-                    'location': location,
-                    'founded_year': founded_year,
-                    'description': description,
-                    'tags': [tag.strip() for tag in tags.split(',') if tag.strip()],
-                    'created_date': datetime.now().isoformat()
-                }
-                
-                # Log company creation
-                st.session_state.logger.log_company_creation(company_data, "Company created via web interface")
-                
-                # Add company to database
-                st.success(f"Company '{name}' added successfully!")
-                st.session_state.data_manager.add_company(company_data)
-                st.rerun()
-                
+        add_company_form()
+
+def add_contact_form(company_names: Tuple[str, ...]):
+    """Form for adding a contact to one of the given companies."""
+    with st.form("add_contact_form"):
+        st.subheader("Add New Contact")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            name = st.text_input("Full Name*")
+            email = st.text_input("Email*")
+            company_name = st.selectbox("Company", company_names)
+            position = st.text_input("Position")
+        
+        with col2:
+            phone = st.text_input("Phone")
+            linkedin = st.text_input("LinkedIn Profile")
+            role_type = st.selectbox("Role Type", [
+                "Decision Maker", "Influencer", "User", "Technical", "Financial"
+            ])
+            notes = st.text_area("Notes")
+        
+        submitted = st.form_submit_button("Add Contact")
+        
+        if submitted and name and email:
+            contact_data = {
+                'id': str(uuid.uuid4()),
+                'name': name,
+                'email': email,
+                'company_name': company_name,
+                'position': position,
+                'phone': phone,
+                'linkedin': linkedin,
+                'role_type': role_type,
+                'notes': notes,
+                'created_date': clock.now_iso()
+            }
+            
+            st.session_state.data_manager.add_contact(contact_data)
+            st.success(f"Contact '{name}' added successfully!")
+            st.rerun()
 
 def contacts_page():
     st.header("👥 Contacts Management")
@@ -402,55 +462,16 @@ def contacts_page():
         contacts = st.session_state.data_manager.get_contacts()
         if contacts:
             df = pd.DataFrame(contacts)
-            st.table(df)
+            st.dataframe(df, use_container_width=True, hide_index=True)
         else:
             st.info("No contacts found. Add your first contact below!")
     
     with tab2:
-        companies = st.session_state.data_manager.get_companies()
-        
-        if not companies:
+        if not st.session_state.data_manager.get_companies():
             st.warning("Please add companies first before adding contacts.")
             return
         
-        with st.form("add_contact_form"):
-            st.subheader("Add New Contact")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                name = st.text_input("Full Name*")
-                email = st.text_input("Email*")
-                company_name = st.selectbox("Company", [c['name'] for c in companies])
-                position = st.text_input("Position")
-            
-            with col2:
-                phone = st.text_input("Phone")
-                linkedin = st.text_input("LinkedIn Profile")
-                role_type = st.selectbox("Role Type", [
-                    "Decision Maker", "Influencer", "User", "Technical", "Financial"
-                ])
-                notes = st.text_area("Notes")
-            
-            submitted = st.form_submit_button("Add Contact")
-            
-            if submitted and name and email:
-                contact_data = {
-                    'id': str(uuid.uuid4()),
-                    'name': name,
-                    'email': email,
-                    'company_name': company_name,
-                    'position': position,
-                    'phone': phone,
-                    'linkedin': linkedin,
-                    'role_type': role_type,
-                    'notes': notes,
-                    'created_date': datetime.now().isoformat()
-                }
-                
-                st.session_state.data_manager.add_contact(contact_data)
-                st.success(f"Contact '{name}' added successfully!")
-                st.rerun()
+        add_contact_form(_company_names())
 
 def business_needs_page():
     st.header("🎯 Business Needs Management")
@@ -475,9 +496,7 @@ def business_needs_page():
             st.info("No business needs found. Create your first business need below!")
     
     with tab2:
-        companies = st.session_state.data_manager.get_companies()
-        
-        if not companies:
+        if not st.session_state.data_manager.get_companies():
             st.warning("Please add companies first before creating business needs.")
             return
         
@@ -488,7 +507,7 @@ def business_needs_page():
             
             with col1:
                 title = st.text_input("Title*")
-                company_name = st.selectbox("Company", [c['name'] for c in companies])
+                company_name = st.selectbox("Company", _company_names())
                 need_type = st.selectbox("Type", [
                     "Pre-sale action", "New customer acquisition", 
                     "Proactive customer contact", "Significant business event",
@@ -529,7 +548,7 @@ def business_needs_page():
                     'timeline': timeline,
                     'description': description,
                     'status': 'active',
-                    'created_date': datetime.now().isoformat()
+                    'created_date': clock.now_iso()
                 }
                 
                 st.session_state.data_manager.add_business_need(business_need_data)
@@ -539,10 +558,19 @@ def business_needs_page():
 def matching_page():
     st.header("🔍 Matching & Connections")
     
-    business_needs = st.session_state.data_manager.get_business_needs()
-    active_needs = [n for n in business_needs if n['status'] == 'active']
-    
-    if not active_needs:
+    # Label -> active business need index, rebuilt only when the data version changes
+    data_version = st.session_state.data_manager.version
+    need_index = st.session_state.get('need_label_index')
+    if need_index is None or need_index[0] != data_version:
+        label_to_need = {}
+        for n in st.session_state.data_manager.get_business_needs():
+            if n['status'] == 'active':
+                label_to_need.setdefault(f"{n['title']} ({n['company_name']})", n)
+        need_index = (data_version, label_to_need)
+        st.session_state.need_label_index = need_index
+    label_to_need = need_index[1]
+    
+    if not label_to_need:
         st.warning("No active business needs found. Please create some business needs first.")
         return
     
@@ -552,12 +580,12 @@ def matching_page():
         st.subheader("Select Business Need")
         selected_need = st.selectbox(
             "Choose a business need to find matches:",
-            [""] + [f"{need['title']} ({need['company_name']})" for need in active_needs]
+            [""] + list(label_to_need.keys())
         )
     
     if selected_need:
         # Find the selected business need
-        need = next((n for n in active_needs if f"{n['title']} ({n['company_name']})" == selected_need), None)
+        need = label_to_need.get(selected_need)
         
         if need:
             with col2:
@@ -568,12 +596,20 @@ def matching_page():
                 st.write(f"**Budget:** {need['budget_range']}")
                 st.write(f"**Timeline:** {need['timeline']}")
             
-            # Find matches
+            # Find matches - remembered across reruns so the connection buttons below stay usable
             if st.button("🔍 Find Matches"):
-                with st.spinner("Finding matches..."):
-                    # Get companies for matching
-                    companies = st.session_state.data_manager.get_companies()
-                    matches = st.session_state.business_matcher.find_matches(need, companies)
+                st.session_state.matched_need_id = need['id']
+            
+            if st.session_state.get('matched_need_id') == need['id']:
+                # Matches stay in session state until another need is matched or the data changes
+                match_key = (need['id'], st.session_state.data_manager.version)
+                cached_matches = st.session_state.get('need_matches')
+                if cached_matches is None or cached_matches[0] != match_key:
+                    with st.spinner("Finding matches..."):
+                        matches = _current_matcher().find_matches(need, st.session_state.data_manager.get_companies())
+                    cached_matches = (match_key, matches)
+                    st.session_state.need_matches = cached_matches
+                matches = cached_matches[1]
                 
                 if matches:
                     st.subheader("Potential Matches")
@@ -600,7 +636,7 @@ def matching_page():
                                         'to_entity': match['company']['name'],
                                         'match_score': match['score'],
                                         'status': 'initiated',
-                                        'created_date': datetime.now().isoformat(),
+                                        'created_date': clock.now_iso(),
                                         'notes': f"Auto-matched based on: {', '.join(match['reasons'])}"
                                     }
                                     st.session_state.data_manager.add_connection(connection_data)
@@ -636,8 +672,45 @@ def connection_management_page():
     if status_filter != "All":
         filtered_connections = [c for c in connections if c['status'] == status_filter]
     
-    for connection in filtered_connections:
-        with st.expander(f"{connection['from_entity']} → {connection['to_entity']} ({connection['status']})"):
+    # Render one page of connections at a time to keep the widget count bounded
+    page_size = 20
+    total_pages = max(1, (len(filtered_connections) + page_size - 1) // page_size)
+    page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1)
+    page_connections = filtered_connections[(page - 1) * page_size:page * page_size]
+    
+    if not page_connections:
+        st.info("No connections found with this status.")
+        return
+    
+    st.caption(f"Page {page} of {total_pages} ({len(filtered_connections)} connections)")
+    summary_df = pd.DataFrame(page_connections).reindex(
+        columns=['from_entity', 'to_entity', 'status', 'match_score', 'created_date']
+    )
+    st.dataframe(
+        summary_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'from_entity': "From",
+            'to_entity': "To",
+            'status': "Status",
+            'match_score': st.column_config.ProgressColumn("Match Score", min_value=0, max_value=1, format="%.2f"),
+            'created_date': "Created"
+        }
+    )
+    
+    # Only the selected connection gets the detail and edit widgets
+    connections_by_id = {c['id']: c for c in page_connections}
+    labels = {c['id']: f"{c['from_entity']} → {c['to_entity']} ({c['status']})" for c in page_connections}
+    selected_connection_id = st.selectbox(
+        "Open details",
+        ["No Selection"] + list(connections_by_id.keys()),
+        format_func=lambda cid: labels.get(cid, cid)
+    )
+    connection = connections_by_id.get(selected_connection_id)
+    
+    if connection:
+        with st.expander(f"{connection['from_entity']} → {connection['to_entity']} ({connection['status']})", expanded=True):
             col1, col2, col3 = st.columns(3)
             
             with col1:
@@ -662,93 +735,149 @@ def connection_management_page():
                     st.success("Status updated!")
                     st.rerun()
             
-            st.write(f"**Notes:** {connection.get('notes', 'No notes')}")
+            notes = DataManager.format_notes(connection['notes']) if 'notes' in connection else 'No notes'
+            st.write(f"**Notes:** {notes}")
             
             # Add notes
             new_note = st.text_area("Add Note", key=f"note_{connection['id']}")
             if st.button("Add Note", key=f"add_note_{connection['id']}") and new_note:
-                current_notes = connection.get('notes', '')
-                updated_notes = f"{current_notes}\n[{datetime.now().strftime('%Y-%m-%d %H:%M')}] {new_note}"
-                st.session_state.data_manager.update_connection_notes(connection['id'], updated_notes)
+                st.session_state.data_manager.add_connection_note(connection['id'], new_note)
                 st.success("Note added!")
                 st.rerun()
 
+# Analytics aggregates - memoized per session by _analytics_counts until the data version changes
+def _analytics_counts(name: str, version: int, compute) -> pd.Series:
+    """Compute an aggregate once per data version and keep it in this session's state."""
+    counts = st.session_state.analytics_counts
+    entry = counts.get(name)
+    if entry is None or entry[0] != version:
+        entry = counts[name] = (version, compute())
+    return entry[1]
+
+def _sector_counts() -> pd.Series:
+    companies = st.session_state.data_manager.get_companies()
+    return pd.Series([c.get('sector', 'Unknown') for c in companies]).value_counts(sort=False)
+
+def _status_counts() -> pd.Series:
+    connections = st.session_state.data_manager.get_connections()
+    return pd.Series([c.get('status', 'Unknown') for c in connections]).value_counts(sort=False)
+
+def _connection_date_counts() -> pd.Series:
+    connections = st.session_state.data_manager.get_connections()
+    # One vectorized parse; repeated timestamps are parsed once and malformed ones are skipped, as in clock.parse_iso
+    connection_dates = pd.to_datetime(
+        pd.Series([c.get('created_date') for c in connections]),
+        format='ISO8601',
+        errors='coerce',
+        cache=True
+    )
+    return connection_dates.dropna().dt.normalize().value_counts().sort_index()
+
+def _analytics_figure(name: str, version: int, trace_type, title: str, **trace_data):
+    """Build a figure once per session and refresh its trace in place when the data version changes."""
+    figures = st.session_state.analytics_figures
+    entry = figures.get(name)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    
+    if entry is None:
+        import plotly.graph_objects as go
+        fig = go.Figure(trace_type(**trace_data), layout={'title': title})
+    else:
+        fig = entry[1]
+        fig.update_traces(**trace_data)
+    figures[name] = (version, fig)
+    return fig
+
 def analytics_page():
+    # Plotly is only needed here, so defer its (heavy) import until the page is opened
+    import plotly.graph_objects as go
+    
     st.header("📈 Analytics & Reports")
     
     companies = st.session_state.data_manager.get_companies()
     connections = st.session_state.data_manager.get_connections()
     business_needs = st.session_state.data_manager.get_business_needs()
+    data_version = st.session_state.data_manager.version
     
     if not companies and not connections:
         st.info("No data available for analytics. Add some companies and create connections first!")
         return
     
-    col1, col2 = st.columns(2)
+    # Only the selected view is computed; st.tabs/expanders would run every section on each rerun
+    view = st.radio(
+        "View",
+        ["Companies by Sector", "Connections by Status", "Connections Over Time", "Success Metrics"],
+        horizontal=True,
+        key="analytics_view"
+    )
     
-    with col1:
+    if view == "Companies by Sector":
         # Company sectors pie chart
         if companies:
             st.subheader("Companies by Sector")
-            sector_counts = {}
-            for company in companies:
-                sector = company.get('sector', 'Unknown')
-                sector_counts[sector] = sector_counts.get(sector, 0) + 1
-            
-            fig_pie = px.pie(
-                values=list(sector_counts.values()),
-                names=list(sector_counts.keys()),
-                title="Company Distribution by Sector"
+            sector_counts = _analytics_counts('sector', data_version, _sector_counts)
+            fig_pie = _analytics_figure(
+                'sector_pie', data_version, go.Pie, "Company Distribution by Sector",
+                labels=sector_counts.index, values=sector_counts.values
             )
             st.plotly_chart(fig_pie, use_container_width=True)
+        else:
+            st.info("No companies yet.")
     
-    with col2:
+    elif view == "Connections by Status":
         # Connection status chart
         if connections:
             st.subheader("Connections by Status")
-            status_counts = {}
-            for connection in connections:
-                status = connection.get('status', 'Unknown')
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
-            fig_bar = px.bar(
-                x=list(status_counts.keys()),
-                y=list(status_counts.values()),
-                title="Connection Status Distribution"
+            status_counts = _analytics_counts('status', data_version, _status_counts)
+            fig_bar = _analytics_figure(
+                'status_bar', data_version, go.Bar, "Connection Status Distribution",
+                x=status_counts.index, y=status_counts.values
             )
             st.plotly_chart(fig_bar, use_container_width=True)
+        else:
+            st.info("No connections yet.")
     
-    # Connections over time
-    if connections:
-        st.subheader("Connections Over Time")
-        connection_dates = [datetime.fromisoformat(c['created_date']).date() for c in connections]
-        date_counts = {}
-        for date in connection_dates:
-            date_counts[date] = date_counts.get(date, 0) + 1
-        
-        if date_counts:
-            fig_line = px.line(
-                x=list(date_counts.keys()),
-                y=list(date_counts.values()),
-                title="Connections Created Over Time"
-            )
-            st.plotly_chart(fig_line, use_container_width=True)
+    elif view == "Connections Over Time":
+        if connections:
+            st.subheader("Connections Over Time")
+            date_counts = _analytics_counts('connection_dates', data_version, _connection_date_counts)
+            if not date_counts.empty:
+                fig_line = _analytics_figure(
+                    'connections_line', data_version, go.Scatter, "Connections Created Over Time",
+                    x=date_counts.index, y=date_counts.values, mode='lines'
+                )
+                st.plotly_chart(fig_line, use_container_width=True)
+        else:
+            st.info("No connections yet.")
     
-    # Success metrics
-    if connections:
-        st.subheader("Success Metrics")
-        
-        total_connections = len(connections)
-        successful_connections = len([c for c in connections if c['status'] == 'connected'])
-        success_rate = (successful_connections / total_connections * 100) if total_connections > 0 else 0
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Connections", total_connections)
-        with col2:
-            st.metric("Successful Connections", successful_connections)
-        with col3:
-            st.metric("Success Rate", f"{success_rate:.1f}%")
+    else:
+        # Success metrics
+        if connections:
+            st.subheader("Success Metrics")
+            
+            # Reuse the cached status counts so the status column is scanned once
+            status_counts = _analytics_counts('status', data_version, _status_counts)
+            total_connections = int(status_counts.sum())
+            successful_connections = int(status_counts.get('connected', 0))
+            success_rate = (successful_connections / total_connections * 100) if total_connections > 0 else 0
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Connections", total_connections)
+            with col2:
+                st.metric("Successful Connections", successful_connections)
+            with col3:
+                st.metric("Success Rate", f"{success_rate:.1f}%")
+        else:
+            st.info("No connections yet.")
+
+def _csv_buffer(records: List[Dict]) -> io.BytesIO:
+    """Write records as CSV into an in-memory binary buffer, in chunks."""
+    buffer = io.BytesIO()
+    pd.DataFrame(records).to_csv(buffer, index=False, encoding='utf-8', chunksize=10_000)
+    buffer.seek(0)
+    return buffer
 
 def settings_page():
     st.header("⚙️ Settings")
@@ -764,11 +893,9 @@ def settings_page():
             if st.button("Export Companies to CSV"):
                 companies = st.session_state.data_manager.get_companies()
                 if companies:
-                    df = pd.DataFrame(companies)
-                    csv = df.to_csv(index=False)
                     st.download_button(
                         label="Download Companies CSV",
-                        data=csv,
+                        data=_csv_buffer(companies),
                         file_name=f"companies_{datetime.now().strftime('%Y%m%d')}.csv",
                         mime="text/csv"
                     )
@@ -779,11 +906,11 @@ def settings_page():
             if st.button("Export Connections to CSV"):
                 connections = st.session_state.data_manager.get_connections()
                 if connections:
-                    df = pd.DataFrame(connections)
-                    csv = df.to_csv(index=False)
                     st.download_button(
                         label="Download Connections CSV",
-                        data=csv,
+                        data=_csv_buffer([
+                            {**c, 'notes': DataManager.format_notes(c.get('notes'))} for c in connections
+                        ]),
                         file_name=f"connections_{datetime.now().strftime('%Y%m%d')}.csv",
                         mime="text/csv"
                     )
@@ -855,6 +982,17 @@ def settings_page():
                 )
             except FileNotFoundError:
                 st.warning("No log file found yet. Perform some operations first.")
+            
+            # Full structured records, one JSON object per line
+            records_file = st.session_state.logger.records_file
+            if records_file and os.path.exists(records_file):
+                with open(records_file, "rb") as f:
+                    st.download_button(
+                        label="Download Structured Records (JSONL)",
+                        data=f.read(),
+                        file_name=f"business_operations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+                        mime="application/jsonl"
+                    )
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
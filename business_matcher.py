@@ -1,10 +1,38 @@
 from typing import Dict, List, Tuple
+import heapq
 import re
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
+try:
+    import ahocorasick  # Optional: scans a description for every tag in one pass
+except ImportError:
+    ahocorasick = None
+
 class BusinessMatcher:
     """Handles matching logic for finding relevant business connections."""
     
+    # Tag vocabularies used by the looking-for rules
+    _INVESTOR_TAGS = frozenset({'investment', 'fund', 'venture', 'capital'})
+    _SUPPLIER_TAGS = frozenset({'supplier', 'manufacturing', 'b2b'})
+    _PARTNER_TAGS = frozenset({'startup', 'innovation', 'tech'})
+    
+    # Company sizes favoured by the looking-for rules
+    _INVESTOR_SIZES = frozenset({'201-1000', '1000+'})
+    _CUSTOMER_SIZES = frozenset({'51-200', '201-1000', '1000+'})
+    _PARTNER_SIZES = frozenset({'11-50', '51-200'})
+    
+    # Cap on the keyword score, also the bound used to prune companies before tag scoring
+    _MAX_TAG_SCORE = 0.8
+    
+    # Below this many distinct tags a plain containment check per tag is as fast as an automaton
+    _AUTOMATON_MIN_TAGS = 32
+    
+    # Maximum number of memoized (need id, company id) scores before the memo is reset
+    _SCORE_CACHE_SIZE = 4096
+    
     def __init__(self):
         self.sector_weights = {
             'exact_match': 1.0,
@@ -43,6 +71,48 @@ class BusinessMatcher:
                 'complementary': ['Retail', 'Manufacturing']
             }
         }
+        
+        # Reverse index: company sector -> target sector -> (weight, relation)
+        self._sector_index: Dict[str, Dict[str, Tuple[float, str]]] = {}
+        for target_sector, relations in self.sector_relationships.items():
+            for relation in ('related', 'complementary'):
+                for company_sector in relations.get(relation, []):
+                    self._sector_index.setdefault(company_sector, {})[target_sector] = (
+                        self.sector_weights[relation], relation
+                    )
+        
+        # Dense sector score matrix [company sector, target sector] over every sector the relationships mention
+        known_sectors = sorted(set(self.sector_relationships) | set(self._sector_index))
+        self._sector_ids = {sector: i for i, sector in enumerate(known_sectors)}
+        self._sector_score_matrix = np.zeros((len(known_sectors), len(known_sectors)))
+        for company_sector, relations in self._sector_index.items():
+            for target_sector, (weight, _) in relations.items():
+                self._sector_score_matrix[self._sector_ids[company_sector], self._sector_ids[target_sector]] = weight
+        np.fill_diagonal(self._sector_score_matrix, self.sector_weights['exact_match'])
+        
+        # Vectorized company layouts keyed by id(companies); the list itself is kept
+        # alongside so the id cannot be reused while the entry is alive
+        self._df_cache: Dict[int, Tuple[List[Dict], int, pd.DataFrame, pd.Series]] = {}
+        
+        # Aho-Corasick automaton for the current tag vocabulary, as (vocabulary, automaton)
+        self._tag_automaton = None
+        
+        # (need id, company id) -> (score, reasons) for pairs already explained
+        self._score_cache: Dict[Tuple[str, str], Tuple[float, Tuple[str, ...]]] = {}
+        
+        # Budget ranges and company sizes on a shared 0.2..1.0 scale; index 0 is "unknown" (0.0)
+        scale = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+        self._budget_idx = {'$0-10K': 1, '$10K-50K': 2, '$50K-100K': 3, '$100K-500K': 4, '$500K+': 5}
+        self._size_idx = {'1-10': 1, '11-50': 2, '51-200': 3, '201-1000': 4, '1000+': 5}
+        self._size_score_matrix = np.array([[max(0, 1.0 - abs(b - s)) for s in scale] for b in scale])
+        
+        # Normalized looking_for value -> rule taking (company, tag set)
+        self._looking_for_rules = {
+            'investor': self._looking_for_investor,
+            'customer': self._looking_for_customer,
+            'supplier': self._looking_for_supplier,
+            'partner': self._looking_for_partner
+        }
     
     def find_matches(self, business_need: Dict, companies: List[Dict] = None) -> List[Dict]:
         """
@@ -60,26 +130,202 @@ class BusinessMatcher:
             # For now, we'll simulate with some sample companies
             companies = self._get_sample_companies()
         
+        if not companies:
+            return []
+        
+        # Score every company at once, then build reasons only for the survivors
+        df, tag_pairs = self._get_companies_frame(companies)
+        partial = self._score_companies(business_need, df)
+        max_tag_bonus = self._MAX_TAG_SCORE * 0.15
+        
+        # Skip the company that created the business need and anything that cannot clear the threshold
+        eligible = (df['name'].to_numpy() != business_need['company_name']) & (partial + max_tag_bonus > 0.3)
+        candidates = np.flatnonzero(eligible)
+        
+        # Early pruning: tags only add to the score, so the 10th best partial score is a floor
+        # that a company must be able to reach to enter the top 10
+        if len(candidates) > 10:
+            floor = np.partition(partial[candidates], -10)[-10]
+            candidates = candidates[partial[candidates] + max_tag_bonus >= floor]
+        
+        tag_scores = self._score_tags(business_need.get('description', ''), tag_pairs, candidates)
+        scores = np.minimum(partial[candidates] + tag_scores * 0.15, 1.0)  # 15% weight
+        candidates, scores = candidates[scores > 0.3], scores[scores > 0.3]
+        
+        # Keep the top 10 by match score; nlargest is stable, so ties keep input order
+        top = heapq.nlargest(10, range(len(candidates)), key=scores.__getitem__)
+        
         matches = []
+        for i in candidates[top]:
+            company = companies[i]
+            match_score, reasons = self._cached_match_score(business_need, company)
+            matches.append({
+                'company': company,
+                'score': match_score,
+                'reasons': reasons
+            })
+        
+        return matches
+    
+    def invalidate(self):
+        """Drop cached company layouts and scores; call after companies or business needs change."""
+        self._df_cache.clear()
+        self._tag_automaton = None
+        self._score_cache.clear()
+    
+    def _get_companies_frame(self, companies: List[Dict]) -> Tuple[pd.DataFrame, pd.Series]:
+        """Return the vectorized layout for a companies list, building it on first use."""
+        cached = self._df_cache.get(id(companies))
+        if cached is not None and cached[0] is companies and cached[1] == len(companies):
+            return cached[2], cached[3]
+        
+        # Only the most recent list is worth keeping; older ones are stale snapshots
+        self._df_cache.clear()
+        df, tag_pairs = self._build_companies_frame(companies)
+        self._df_cache[id(companies)] = (companies, len(companies), df, tag_pairs)
+        return df, tag_pairs
+    
+    def _build_companies_frame(self, companies: List[Dict]) -> Tuple[pd.DataFrame, pd.Series]:
+        """Lay companies out column-wise, plus one (company row, tag) pair per tag, for vectorized scoring."""
+        df = pd.DataFrame({
+            'name': [c['name'] for c in companies],
+            'sector': [c.get('sector', '') for c in companies],
+            'size': [c.get('size', '') for c in companies],
+            'tags': [tuple(c.get('tags', [])) for c in companies]
+        })
+        # Compact dtypes: sizes as int8 codes, flags as 1-byte bools, sectors as categorical codes
+        df['size_idx'] = df['size'].map(self._size_idx).fillna(0).astype('int8')
+        df['has_size'] = [bool(c.get('size', '')) for c in companies]
+        sector_lower = df['sector'].str.lower()
+        df['is_finance'] = sector_lower.str.contains('finance', regex=False)
+        df['is_manufacturing'] = sector_lower.str.contains('manufacturing', regex=False)
+        df['has_investor_tag'] = [not self._INVESTOR_TAGS.isdisjoint(tags) for tags in df['tags']]
+        df['has_b2b_tag'] = ['b2b' in tags for tags in df['tags']]
+        df['has_supplier_tag'] = [not self._SUPPLIER_TAGS.isdisjoint(tags) for tags in df['tags']]
+        df['has_partner_tag'] = [not self._PARTNER_TAGS.isdisjoint(tags) for tags in df['tags']]
+        df['sector_id'] = np.array([self._sector_ids.get(c.get('sector', ''), -1) for c in companies], dtype='int16')
+        df['sector'] = df['sector'].astype('category')
+        
+        # One entry per (company row, tag), lowercased once and stored as a categorical
+        # so the distinct tag vocabulary is precomputed for every later match
+        tag_pairs = df['tags'].explode().dropna().map(str.lower).astype('category')
+        return df, tag_pairs
+    
+    def _score_companies(self, business_need: Dict, df: pd.DataFrame) -> np.ndarray:
+        """Vectorized _calculate_match_score over a companies frame, minus the tag component."""
+        score = self._score_sectors(business_need.get('target_sectors', []), df) * 0.4  # 40% weight
+        score = score + self._score_looking_for(business_need.get('looking_for', ''), df) * 0.3  # 30% weight
+        score = score + self._score_company_size(business_need.get('budget_range', ''), df) * 0.15  # 15% weight
+        return score
+    
+    def _score_sectors(self, target_sectors: List[str], df: pd.DataFrame) -> np.ndarray:
+        """Best sector weight per company across all target sectors."""
+        if not target_sectors:
+            return np.zeros(len(df))
+        
+        # Best weight per known sector across the target columns; the trailing slot scores
+        # sector_id -1 (empty or outside the relationship table) as no match
+        weights = np.zeros(len(self._sector_ids) + 1)
+        target_ids = [self._sector_ids[t] for t in target_sectors if t in self._sector_ids]
+        if target_ids:
+            weights[:-1] = self._sector_score_matrix[:, target_ids].max(axis=1)
+        scores = weights[df['sector_id'].to_numpy()]
+        
+        # Sectors outside the table can still match a target exactly
+        other_targets = [t for t in target_sectors if t and t not in self._sector_ids]
+        if other_targets:
+            scores = np.where(df['sector'].isin(other_targets).to_numpy(), self.sector_weights['exact_match'], scores)
+        return scores
+    
+    def _score_looking_for(self, looking_for: str, df: pd.DataFrame) -> np.ndarray:
+        """Looking-for score per company, applying the same rule order as _match_looking_for."""
+        looking_for = looking_for.lower() if looking_for else ''
+        size_idx = df['size_idx'].to_numpy()
+        
+        def flag(column: str) -> np.ndarray:
+            return df[column].to_numpy(dtype=bool)
+        
+        def size_in(sizes: frozenset) -> np.ndarray:
+            lookup = np.zeros(len(self._size_score_matrix), dtype=bool)
+            lookup[[self._size_idx[size] for size in sizes]] = True
+            return lookup[size_idx]
+        
+        # Nested where mirrors the first-rule-wins order of the scalar rules
+        if looking_for == 'investor':
+            return np.where(flag('is_finance'), 0.8,
+                            np.where(flag('has_investor_tag'), 0.9,
+                                     np.where(size_in(self._INVESTOR_SIZES), 0.5, 0.0)))
+        if looking_for == 'customer':
+            return np.where(size_in(self._CUSTOMER_SIZES), 0.7, np.where(flag('has_b2b_tag'), 0.6, 0.0))
+        if looking_for == 'supplier':
+            return np.where(flag('is_manufacturing'), 0.8, np.where(flag('has_supplier_tag'), 0.7, 0.0))
+        if looking_for == 'partner':
+            return np.where(size_in(self._PARTNER_SIZES), 0.6, np.where(flag('has_partner_tag'), 0.7, 0.0))
+        return np.zeros(len(df))
+    
+    def _score_company_size(self, budget_range: str, df: pd.DataFrame) -> np.ndarray:
+        """Budget/size closeness per company; scores of 0.4 or less count as no match."""
+        if not budget_range:
+            return np.zeros(len(df))
         
-        for company in companies:
-            # Skip the company that created the business need
-            if company['name'] == business_need['company_name']:
-                continue
-            
-            match_score, reasons = self._calculate_match_score(business_need, company)
-            
-            if match_score > 0.3:  # Minimum threshold
-                matches.append({
-                    'company': company,
-                    'score': match_score,
-                    'reasons': reasons
-                })
-        
-        # Sort by match score descending
-        matches.sort(key=lambda x: x['score'], reverse=True)
-        
-        return matches[:10]  # Return top 10 matches
+        score = self._size_score_matrix[self._budget_idx.get(budget_range, 0)][df['size_idx'].to_numpy()]
+        return np.where(df['has_size'].to_numpy() & (score > 0.4), score, 0.0)
+    
+    def _score_tags(self, description: str, tag_pairs: pd.Series, rows: np.ndarray) -> np.ndarray:
+        """Keyword score for each company row in rows (ascending) from its tags found in the need description."""
+        if not description or len(rows) == 0:
+            return np.zeros(len(rows))
+        
+        description_lower = description.lower()
+        
+        # Check each distinct tag against the description once, not once per company
+        is_hit = self._find_tags(description_lower, tag_pairs.cat.categories)
+        
+        # Pairs are grouped by ascending company row, so each row's pairs are one slice [start, end)
+        owners = tag_pairs.index.to_numpy()
+        starts = np.searchsorted(owners, rows, side='left')
+        lengths = np.searchsorted(owners, rows, side='right') - starts
+        slots = np.repeat(np.arange(len(rows)), lengths)
+        pair_positions = np.arange(lengths.sum()) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        
+        # Only the given rows' pairs are looked up and counted
+        hits = is_hit[tag_pairs.cat.codes.to_numpy()[pair_positions]]
+        matched_counts = np.bincount(slots[hits], minlength=len(rows)).astype(float)
+        return np.minimum(matched_counts * 0.2, self._MAX_TAG_SCORE)  # Max 0.8, 0.2 per tag
+    
+    def _find_tags(self, description_lower: str, vocabulary: pd.Index) -> np.ndarray:
+        """Mask over a lowercased tag vocabulary of the tags contained in the description."""
+        if ahocorasick is None or len(vocabulary) < self._AUTOMATON_MIN_TAGS:
+            return np.fromiter((tag in description_lower for tag in vocabulary), dtype=bool, count=len(vocabulary))
+        
+        # The vocabulary Index belongs to the cached companies layout, so identity tells us it is unchanged
+        if self._tag_automaton is None or self._tag_automaton[0] is not vocabulary:
+            automaton = ahocorasick.Automaton()
+            for position, tag in enumerate(vocabulary):
+                automaton.add_word(tag, position)
+            automaton.make_automaton()
+            self._tag_automaton = (vocabulary, automaton)
+        
+        is_hit = np.zeros(len(vocabulary), dtype=bool)
+        for _, position in self._tag_automaton[1].iter(description_lower):
+            is_hit[position] = True
+        if '' in vocabulary:
+            is_hit[vocabulary.get_loc('')] = True  # The empty tag is in every description
+        return is_hit
+    
+    def _cached_match_score(self, business_need: Dict, company: Dict) -> Tuple[float, List[str]]:
+        """_calculate_match_score memoized by (need id, company id) until the next invalidate()."""
+        key = (business_need.get('id'), company.get('id'))
+        if key[0] is None or key[1] is None:
+            return self._calculate_match_score(business_need, company)
+        
+        cached = self._score_cache.get(key)
+        if cached is None:
+            if len(self._score_cache) >= self._SCORE_CACHE_SIZE:
+                self._score_cache.clear()
+            score, reasons = self._calculate_match_score(business_need, company)
+            cached = self._score_cache[key] = (score, tuple(reasons))
+        return cached[0], list(cached[1])
     
     def _calculate_match_score(self, business_need: Dict, company: Dict) -> Tuple[float, List[str]]:
         """Calculate match score between a business need and a company."""
@@ -98,7 +344,8 @@ class BusinessMatcher:
         # Looking for type matching
         looking_for_score, looking_for_reason = self._match_looking_for(
             business_need.get('looking_for', ''), 
-            company
+            company,
+            frozenset(company.get('tags', []))
         )
         score += looking_for_score * 0.3  # 30% weight
         if looking_for_reason:
@@ -133,100 +380,76 @@ class BusinessMatcher:
         if company_sector in target_sectors:
             return self.sector_weights['exact_match'], f"Exact sector match ({company_sector})"
         
-        # Related sector match
-        for target_sector in target_sectors:
-            if target_sector in self.sector_relationships:
-                related = self.sector_relationships[target_sector].get('related', [])
-                if company_sector in related:
-                    return self.sector_weights['related'], f"Related sector ({company_sector} ↔ {target_sector})"
+        # Related/complementary match - the strongest relation wins, earliest target on ties
+        relations = self._sector_index.get(company_sector)
+        if not relations:
+            return 0.0, ""
         
-        # Complementary sector match
+        best_weight, best_relation, best_target = 0.0, None, None
         for target_sector in target_sectors:
-            if target_sector in self.sector_relationships:
-                complementary = self.sector_relationships[target_sector].get('complementary', [])
-                if company_sector in complementary:
-                    return self.sector_weights['complementary'], f"Complementary sector ({company_sector} ↔ {target_sector})"
-        
+            hit = relations.get(target_sector)
+            if hit and hit[0] > best_weight:
+                best_weight, best_relation = hit
+                best_target = target_sector
+        
+        if best_relation == 'related':
+            return best_weight, f"Related sector ({company_sector} ↔ {best_target})"
+        if best_relation == 'complementary':
+            return best_weight, f"Complementary sector ({company_sector} ↔ {best_target})"
         return 0.0, ""
     
-    def _match_looking_for(self, looking_for: str, company: Dict) -> Tuple[float, str]:
+    def _match_looking_for(self, looking_for: str, company: Dict, company_tags: frozenset) -> Tuple[float, str]:
         """Match what the business need is looking for with company characteristics."""
         if not looking_for:
             return 0.0, ""
         
-        company_size = company.get('size', '')
-        company_tags = company.get('tags', [])
-        company_description = company.get('description', '').lower()
-        
-        score = 0.0
-        reason = ""
-        
-        if looking_for.lower() == 'investor':
-            # Look for investment-related characteristics
-            if 'finance' in company.get('sector', '').lower():
-                score = 0.8
-                reason = "Financial sector company (potential investor)"
-            elif any(tag in ['investment', 'fund', 'venture', 'capital'] for tag in company_tags):
-                score = 0.9
-                reason = "Investment-related tags"
-            elif company_size in ['201-1000', '1000+']:
-                score = 0.5
-                reason = "Large company (potential corporate investor)"
-        
-        elif looking_for.lower() == 'customer':
-            # Look for potential customer characteristics
-            if company_size in ['51-200', '201-1000', '1000+']:
-                score = 0.7
-                reason = "Good size for potential customer"
-            elif 'b2b' in company_tags:
-                score = 0.6
-                reason = "B2B company (potential customer)"
-        
-        elif looking_for.lower() == 'supplier':
-            # Look for supplier characteristics
-            if 'manufacturing' in company.get('sector', '').lower():
-                score = 0.8
-                reason = "Manufacturing sector (potential supplier)"
-            elif any(tag in ['supplier', 'manufacturing', 'b2b'] for tag in company_tags):
-                score = 0.7
-                reason = "Supplier-related characteristics"
-        
-        elif looking_for.lower() == 'partner':
-            # Look for partnership characteristics
-            if company_size in ['11-50', '51-200']:
-                score = 0.6
-                reason = "Similar size for partnership"
-            elif any(tag in ['startup', 'innovation', 'tech'] for tag in company_tags):
-                score = 0.7
-                reason = "Innovation-focused (good partner)"
-        
-        return score, reason
+        rule = self._looking_for_rules.get(looking_for.lower())
+        return rule(company, company_tags) if rule else (0.0, "")
+    
+    def _looking_for_investor(self, company: Dict, company_tags: frozenset) -> Tuple[float, str]:
+        """Look for investment-related characteristics."""
+        if 'finance' in company.get('sector', '').lower():
+            return 0.8, "Financial sector company (potential investor)"
+        if not self._INVESTOR_TAGS.isdisjoint(company_tags):
+            return 0.9, "Investment-related tags"
+        if company.get('size', '') in self._INVESTOR_SIZES:
+            return 0.5, "Large company (potential corporate investor)"
+        return 0.0, ""
+    
+    def _looking_for_customer(self, company: Dict, company_tags: frozenset) -> Tuple[float, str]:
+        """Look for potential customer characteristics."""
+        if company.get('size', '') in self._CUSTOMER_SIZES:
+            return 0.7, "Good size for potential customer"
+        if 'b2b' in company_tags:
+            return 0.6, "B2B company (potential customer)"
+        return 0.0, ""
+    
+    def _looking_for_supplier(self, company: Dict, company_tags: frozenset) -> Tuple[float, str]:
+        """Look for supplier characteristics."""
+        if 'manufacturing' in company.get('sector', '').lower():
+            return 0.8, "Manufacturing sector (potential supplier)"
+        if not self._SUPPLIER_TAGS.isdisjoint(company_tags):
+            return 0.7, "Supplier-related characteristics"
+        return 0.0, ""
+    
+    def _looking_for_partner(self, company: Dict, company_tags: frozenset) -> Tuple[float, str]:
+        """Look for partnership characteristics."""
+        if company.get('size', '') in self._PARTNER_SIZES:
+            return 0.6, "Similar size for partnership"
+        if not self._PARTNER_TAGS.isdisjoint(company_tags):
+            return 0.7, "Innovation-focused (good partner)"
+        return 0.0, ""
     
     def _match_company_size(self, budget_range: str, company_size: str) -> Tuple[float, str]:
         """Match budget range with company size."""
         if not budget_range or not company_size:
             return 0.0, ""
         
-        # Simple heuristic: larger budgets match with larger companies
-        budget_score = {
-            '$0-10K': 0.2,
-            '$10K-50K': 0.4,
-            '$50K-100K': 0.6,
-            '$100K-500K': 0.8,
-            '$500K+': 1.0
-        }.get(budget_range, 0.0)
-        
-        size_score = {
-            '1-10': 0.2,
-            '11-50': 0.4,
-            '51-200': 0.6,
-            '201-1000': 0.8,
-            '1000+': 1.0
-        }.get(company_size, 0.0)
-        
-        # Match score based on how close budget and size are
-        diff = abs(budget_score - size_score)
-        score = max(0, 1.0 - diff)
+        # Simple heuristic: larger budgets match with larger companies, scored by how close they are
+        score = float(self._size_score_matrix[
+            self._budget_idx.get(budget_range, 0),
+            self._size_idx.get(company_size, 0)
+        ])
         
         if score > 0.7:
             return score, f"Good budget-size match ({budget_range} ↔ {company_size})"
@@ -248,7 +471,7 @@ class BusinessMatcher:
                 matched_tags.append(tag)
         
         if matched_tags:
-            score = min(len(matched_tags) * 0.2, 0.8)  # Max 0.8, 0.2 per tag
+            score = min(len(matched_tags) * 0.2, self._MAX_TAG_SCORE)  # Max 0.8, 0.2 per tag
             return score, f"Keyword match: {', '.join(matched_tags)}"
         
         return 0.0, ""
@@ -300,7 +523,7 @@ class BusinessMatcher:
     
     def get_match_explanation(self, business_need: Dict, company: Dict) -> str:
         """Get a detailed explanation of why a company matches a business need."""
-        score, reasons = self._calculate_match_score(business_need, company)
+        score, reasons = self._cached_match_score(business_need, company)
         
         explanation = f"Match Score: {score:.1%}\n\n"
         explanation += "Matching Factors:\n"
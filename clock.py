@@ -0,0 +1,36 @@
+import functools
+import time
+from datetime import datetime
+from typing import Optional, Tuple
+
+# Last wall-clock second seen, as (epoch second, datetime, ISO date and time up to the second)
+_cache: Tuple[int, datetime, str] = (-1, datetime.min, '')
+
+def _read() -> Tuple[Tuple[int, datetime, str], int]:
+    """The cache entry for the current second, refreshed when the clock has moved on, and the microseconds."""
+    global _cache
+    second, microsecond = divmod(time.time_ns() // 1000, 1_000_000)
+    cached = _cache
+    if cached[0] != second:
+        moment = datetime.fromtimestamp(second)
+        cached = _cache = (second, moment, moment.isoformat())
+    return cached, microsecond
+
+def now_iso() -> str:
+    """Current local time as datetime.now().isoformat() would give it, with the microseconds always included."""
+    cached, microsecond = _read()
+    return f"{cached[2]}.{microsecond:06d}"
+
+def now() -> Tuple[datetime, str]:
+    """Current local time as a datetime and as its now_iso() string, from a single clock read."""
+    cached, microsecond = _read()
+    return cached[1].replace(microsecond=microsecond), f"{cached[2]}.{microsecond:06d}"
+
+# Lives here rather than in app.py, which Streamlit re-executes on every rerun, so the cache lasts for the process
+@functools.lru_cache(maxsize=4096)
+def parse_iso(value: str) -> Optional[datetime]:
+    """Parse an ISO timestamp once per distinct string; None if it is malformed."""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, TypeError, ValueError):
+        return None
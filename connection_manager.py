@@ -1,15 +1,92 @@
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-import uuid
+from typing import Dict, List, Mapping, Optional, Tuple
+from collections import Counter
+from datetime import timedelta
+import os
+import re
+import string
+import sys
+from types import MappingProxyType
+
+import numpy as np
+
+import clock
+
+# Template placeholders such as {contact_name}
+TEMPLATE_VARIABLE_PATTERN = re.compile(r'\{(\w+)\}')
+
+# Introduction reasons by business need type; entries with a {looking_for} field are formatted on use
+_INTRODUCTION_REASONS = MappingProxyType({
+    'Pre-sale action': 'We are currently in our pre-sales process and exploring strategic partnerships.',
+    'New customer acquisition': 'We are expanding our customer base and believe your company could benefit from our solutions.',
+    'Proactive customer contact': 'We are reaching out to existing clients to explore additional collaboration opportunities.',
+    'Significant business event': "Following recent developments in our business, we are seeking {looking_for} partnerships.",
+    'Professional management': 'As part of our ongoing business development efforts, we are connecting with industry leaders.',
+    'Low communication frequency': 'We wanted to reconnect and explore current collaboration opportunities.'
+})
+_INTRODUCTION_REASON_DEFAULT = 'We are currently looking for {looking_for} partnerships and believe your company could be a great fit.'
+
+# Value proposition templates by lowercased looking_for
+_VALUE_PROPOSITIONS = MappingProxyType({
+    'investor': "We are seeking investment to scale our operations in the {sectors} sector(s). Your expertise in {sector} could provide valuable strategic guidance.",
+    'customer': "Our solutions could help streamline your operations in {sector} and drive significant value for your business.",
+    'supplier': "We believe your capabilities in {sector} could perfectly complement our business needs and help us serve our customers better.",
+    'partner': "A strategic partnership between our companies could create mutual value and help us both expand in the {sector} market.",
+    'service provider': "Your expertise in {sector} could help us enhance our service offerings and operational efficiency."
+})
+_VALUE_PROPOSITION_DEFAULT = "We believe there could be valuable synergies between our organizations in the {sector} space."
+
+# Follow-up number -> template type and reason; other numbers fall back to the final ones
+_FOLLOW_UP_TEMPLATES = MappingProxyType({1: 'follow_up_1', 2: 'follow_up_2'})
+_FOLLOW_UP_REASONS = MappingProxyType({
+    1: "I wanted to check if you had a chance to review my previous message about potential collaboration opportunities.",
+    2: "I realize you must be very busy, but I wanted to reach out one more time as I believe this opportunity could be mutually beneficial."
+})
+_FINAL_FOLLOW_UP_REASON = "I wanted to make one final attempt to connect, as I believe there could be significant value in exploring this opportunity together."
+
+# Introduction-email reason; the score is filled in as a whole percent
+_CONNECTION_REASON = "Based on my understanding of both your businesses, I believe there could be valuable synergies worth exploring. The match score for this connection is {score:.0%}."
+_CONNECTION_REASON_NO_SCORE = _CONNECTION_REASON.format(score=0)
+
+# The form's looking_for options mapped to their _VALUE_PROPOSITIONS keys, so the common case skips lower()
+_LOOKING_FOR_KEYS = MappingProxyType({key.title(): key for key in _VALUE_PROPOSITIONS})
+
+def _compile_template(text: str) -> Optional[tuple]:
+    """Split a format string once into (literal, field name, format spec) chunks."""
+    chunks = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(text):
+        # Conversions, positional/indexed fields and nested specs are left to str.format
+        if field_name is not None and (conversion or not field_name.isidentifier() or '{' in format_spec):
+            return None
+        chunks.append((sys.intern(literal), field_name, format_spec))
+    return tuple(chunks)
+
+def _render_chunks(chunks: Optional[tuple], text: str, values: Mapping) -> str:
+    """Fill a template from its pre-parsed chunks, or with str.format when it could not be pre-parsed."""
+    if chunks is None:
+        return text.format(**values)
+    
+    parts = []
+    append = parts.append
+    for literal, field_name, format_spec in chunks:
+        append(literal)
+        if field_name is not None:
+            append(format(values[field_name], format_spec))
+    return ''.join(parts)
+
+def _scan_template_variables(template: Mapping[str, str]) -> Tuple[str, ...]:
+    """Collect the sorted placeholder names used in a template's subject and body."""
+    variables = set(TEMPLATE_VARIABLE_PATTERN.findall(template['subject']))
+    variables.update(TEMPLATE_VARIABLE_PATTERN.findall(template['body']))
+    return tuple(sorted(variables))
 
 class ConnectionManager:
     """Manages business connections, email templates, and follow-ups."""
     
-    def __init__(self):
-        self.email_templates = {
-            'initial_outreach': {
-                'subject': 'Introduction - {from_company} & {to_company}',
-                'body': """Dear {contact_name},
+    # Email templates and pipeline stages are fixed, so they live once on the class, read-only
+    _EMAIL_TEMPLATES = MappingProxyType({
+        'initial_outreach': MappingProxyType({
+            'subject': 'Introduction - {from_company} & {to_company}',
+            'body': """Dear {contact_name},
 
 I hope this email finds you well. My name is {sender_name} from {from_company}.
 
@@ -26,10 +103,10 @@ Best regards,
 {sender_title}
 {from_company}
 {sender_contact}"""
-            },
-            'follow_up_1': {
-                'subject': 'Re: Introduction - {from_company} & {to_company}',
-                'body': """Hi {contact_name},
+        }),
+        'follow_up_1': MappingProxyType({
+            'subject': 'Re: Introduction - {from_company} & {to_company}',
+            'body': """Hi {contact_name},
 
 I wanted to follow up on my previous email regarding potential collaboration between {from_company} and {to_company}.
 
@@ -41,10 +118,10 @@ Thank you for your time.
 
 Best regards,
 {sender_name}"""
-            },
-            'follow_up_2': {
-                'subject': 'Final follow-up - {from_company} collaboration opportunity',
-                'body': """Hi {contact_name},
+        }),
+        'follow_up_2': MappingProxyType({
+            'subject': 'Final follow-up - {from_company} collaboration opportunity',
+            'body': """Hi {contact_name},
 
 This is my final follow-up regarding the potential collaboration opportunity between {from_company} and {to_company}.
 
@@ -54,10 +131,10 @@ Thank you for your time and consideration.
 
 Best regards,
 {sender_name}"""
-            },
-            'introduction_email': {
-                'subject': 'Introduction: {party1_name} <> {party2_name}',
-                'body': """Hi {party1_name} and {party2_name},
+        }),
+        'introduction_email': MappingProxyType({
+            'subject': 'Introduction: {party1_name} <> {party2_name}',
+            'body': """Hi {party1_name} and {party2_name},
 
 I'm pleased to introduce you both as I believe there could be valuable synergies between your organizations.
 
@@ -71,18 +148,85 @@ I'll let you both take it from here. Wishing you a productive conversation!
 
 Best regards,
 {introducer_name}"""
-            }
-        }
-        
-        self.connection_stages = [
-            'initiated',
-            'contacted',
-            'responded',
-            'meeting_scheduled',
-            'meeting_completed',
-            'connected',
-            'closed'
-        ]
+        })
+    })
+    
+    CONNECTION_STAGES = (
+        'initiated',
+        'contacted',
+        'responded',
+        'meeting_scheduled',
+        'meeting_completed',
+        'connected',
+        'closed'
+    )
+    
+    # Kept under their old names for existing callers
+    email_templates = _EMAIL_TEMPLATES
+    connection_stages = CONNECTION_STAGES
+    
+    # Stage name -> int8 id for the array form of the statistics; anything else gets len(stages)
+    _STAGE_IDS = MappingProxyType({stage: i for i, stage in enumerate(CONNECTION_STAGES)})
+    
+    # Suggested next actions per pipeline stage
+    _STAGE_ACTIONS = MappingProxyType({
+        'initiated': (
+            'Send initial outreach email',
+            'Research contact information',
+            'Prepare company overview'
+        ),
+        'contacted': (
+            'Wait for response (3-5 business days)',
+            'Prepare for potential meeting',
+            'Research their recent news/updates'
+        ),
+        'responded': (
+            'Schedule introductory call',
+            'Prepare meeting agenda',
+            'Send calendar invite'
+        ),
+        'meeting_scheduled': (
+            'Prepare presentation materials',
+            'Research attendees',
+            'Confirm meeting details'
+        ),
+        'meeting_completed': (
+            'Send follow-up summary',
+            'Share relevant documents',
+            'Schedule next steps'
+        ),
+        'connected': (
+            'Monitor relationship progress',
+            'Schedule regular check-ins',
+            'Track mutual value creation'
+        ),
+        'closed': (
+            'Document lessons learned',
+            'Update contact information',
+            'Consider future opportunities'
+        )
+    })
+    _DEFAULT_STAGE_ACTIONS = ('Review connection status',)
+    
+    # (template type, 'subject'/'body') -> pre-parsed chunks, or None if the text needs str.format
+    _COMPILED_TEMPLATES = MappingProxyType({
+        (template_type, part): _compile_template(template[part])
+        for template_type, template in _EMAIL_TEMPLATES.items()
+        for part in ('subject', 'body')
+    })
+    
+    # template type -> sorted variable names used in its subject and body
+    _TEMPLATE_VARS = MappingProxyType({
+        template_type: _scan_template_variables(template)
+        for template_type, template in _EMAIL_TEMPLATES.items()
+    })
+    
+    __slots__ = ()
+    
+    def _render_template(self, template_type: str, part: str, values: Dict) -> str:
+        """Fill one part of a template from its pre-parsed chunks; raises KeyError like str.format."""
+        return _render_chunks(self._COMPILED_TEMPLATES[(template_type, part)],
+                              self._EMAIL_TEMPLATES[template_type][part], values)
     
     def generate_email(self, template_type: str, **kwargs) -> Dict[str, str]:
         """
@@ -95,24 +239,48 @@ Best regards,
         Returns:
             Dictionary with 'subject' and 'body' keys
         """
-        if template_type not in self.email_templates:
+        if template_type not in self._EMAIL_TEMPLATES:
             raise ValueError(f"Template type '{template_type}' not found")
         
-        template = self.email_templates[template_type]
-        
         try:
-            subject = template['subject'].format(**kwargs)
-            body = template['body'].format(**kwargs)
+            subject = self._render_template(template_type, 'subject', kwargs)
+            body = self._render_template(template_type, 'body', kwargs)
             
             return {
                 'subject': subject,
                 'body': body,
                 'template_type': template_type,
-                'generated_at': datetime.now().isoformat()
+                'generated_at': clock.now_iso()
             }
         except KeyError as e:
             raise ValueError(f"Missing required parameter: {e}")
     
+    def generate_emails_bulk(self, template_type: str, kwargs_list: List[Dict]) -> List[Dict[str, str]]:
+        """Generate one email per variables dict, sharing the template lookup and timestamp across the batch."""
+        if template_type not in self._EMAIL_TEMPLATES:
+            raise ValueError(f"Template type '{template_type}' not found")
+        
+        template = self._EMAIL_TEMPLATES[template_type]
+        subject_chunks = self._COMPILED_TEMPLATES[(template_type, 'subject')]
+        body_chunks = self._COMPILED_TEMPLATES[(template_type, 'body')]
+        subject_text, body_text = template['subject'], template['body']
+        generated_at = clock.now_iso()
+        
+        emails = []
+        append = emails.append
+        try:
+            for values in kwargs_list:
+                append({
+                    'subject': _render_chunks(subject_chunks, subject_text, values),
+                    'body': _render_chunks(body_chunks, body_text, values),
+                    'template_type': template_type,
+                    'generated_at': generated_at
+                })
+        except KeyError as e:
+            raise ValueError(f"Missing required parameter: {e}")
+        
+        return emails
+    
     def generate_initial_outreach_email(self, business_need: Dict, target_company: Dict, 
                                       sender_info: Dict, target_contact: Dict = None) -> Dict[str, str]:
         """Generate an initial outreach email for a business connection."""
@@ -140,9 +308,8 @@ Best regards,
     def generate_follow_up_email(self, connection: Dict, follow_up_number: int = 1) -> Dict[str, str]:
         """Generate a follow-up email for an existing connection."""
         
-        template_type = f'follow_up_{follow_up_number}'
-        if template_type not in self.email_templates:
-            template_type = 'follow_up_2'  # Use final follow-up as default
+        # Anything but the first follow-up uses the final follow-up template
+        template_type = _FOLLOW_UP_TEMPLATES.get(follow_up_number, 'follow_up_2')
         
         # Create follow-up reason
         follow_up_reason = self._create_follow_up_reason(connection, follow_up_number)
@@ -176,124 +343,64 @@ Best regards,
     
     def _create_introduction_reason(self, business_need: Dict) -> str:
         """Create an introduction reason based on the business need."""
-        need_type = business_need.get('type', '')
-        looking_for = business_need.get('looking_for', '')
-        
-        reasons = {
-            'Pre-sale action': 'We are currently in our pre-sales process and exploring strategic partnerships.',
-            'New customer acquisition': 'We are expanding our customer base and believe your company could benefit from our solutions.',
-            'Proactive customer contact': 'We are reaching out to existing clients to explore additional collaboration opportunities.',
-            'Significant business event': f"Following recent developments in our business, we are seeking {looking_for.lower()} partnerships.",
-            'Professional management': 'As part of our ongoing business development efforts, we are connecting with industry leaders.',
-            'Low communication frequency': 'We wanted to reconnect and explore current collaboration opportunities.'
-        }
+        reason = _INTRODUCTION_REASONS.get(business_need.get('type', ''), _INTRODUCTION_REASON_DEFAULT)
+        if '{' not in reason:
+            return reason
         
-        return reasons.get(need_type, f'We are currently looking for {looking_for.lower()} partnerships and believe your company could be a great fit.')
+        return reason.format(looking_for=business_need.get('looking_for', '').lower())
     
     def _create_value_proposition(self, business_need: Dict, target_company: Dict) -> str:
         """Create a value proposition based on the business need and target company."""
-        looking_for = business_need.get('looking_for', '').lower()
-        target_sectors = business_need.get('target_sectors', [])
-        company_sector = target_company.get('sector', '')
-        
-        propositions = {
-            'investor': f"We are seeking investment to scale our operations in the {', '.join(target_sectors).lower()} sector(s). Your expertise in {company_sector.lower()} could provide valuable strategic guidance.",
-            'customer': f"Our solutions could help streamline your operations in {company_sector.lower()} and drive significant value for your business.",
-            'supplier': f"We believe your capabilities in {company_sector.lower()} could perfectly complement our business needs and help us serve our customers better.",
-            'partner': f"A strategic partnership between our companies could create mutual value and help us both expand in the {company_sector.lower()} market.",
-            'service provider': f"Your expertise in {company_sector.lower()} could help us enhance our service offerings and operational efficiency."
-        }
+        looking_for = business_need.get('looking_for', '')
+        looking_for = _LOOKING_FOR_KEYS.get(looking_for) or looking_for.lower()
+        company_sector = target_company.get('sector', '').lower()
         
-        return propositions.get(looking_for, f"We believe there could be valuable synergies between our organizations in the {company_sector.lower()} space.")
+        proposition = _VALUE_PROPOSITIONS.get(looking_for, _VALUE_PROPOSITION_DEFAULT)
+        if looking_for == 'investor':
+            # Only the investor text mentions the need's own sectors
+            sectors = ', '.join(business_need.get('target_sectors', [])).lower()
+            return proposition.format(sectors=sectors, sector=company_sector)
+        return proposition.format(sector=company_sector)
     
     def _create_follow_up_reason(self, connection: Dict, follow_up_number: int) -> str:
         """Create a follow-up reason based on the connection and follow-up number."""
-        if follow_up_number == 1:
-            return "I wanted to check if you had a chance to review my previous message about potential collaboration opportunities."
-        elif follow_up_number == 2:
-            return "I realize you must be very busy, but I wanted to reach out one more time as I believe this opportunity could be mutually beneficial."
-        else:
-            return "I wanted to make one final attempt to connect, as I believe there could be significant value in exploring this opportunity together."
+        return _FOLLOW_UP_REASONS.get(follow_up_number, _FINAL_FOLLOW_UP_REASON)
     
     def _create_connection_reason(self, connection: Dict) -> str:
         """Create a connection reason for introduction emails."""
-        return f"Based on my understanding of both your businesses, I believe there could be valuable synergies worth exploring. The match score for this connection is {connection.get('match_score', 0):.0%}."
+        score = connection.get('match_score', 0)
+        if not score:
+            return _CONNECTION_REASON_NO_SCORE
+        
+        # The :.0% spec renders NaN/inf as the baseline did instead of failing like round() would
+        return _CONNECTION_REASON.format(score=score)
     
     def schedule_follow_up(self, connection_id: str, days_from_now: int = 7) -> Dict:
         """Schedule a follow-up for a connection."""
-        follow_up_date = datetime.now() + timedelta(days=days_from_now)
+        now, now_iso = clock.now()
+        follow_up_date = now + timedelta(days=days_from_now)
         
         return {
-            'id': str(uuid.uuid4()),
+            'id': os.urandom(16).hex(),
             'connection_id': connection_id,
             'scheduled_date': follow_up_date.isoformat(),
             'status': 'scheduled',
             'type': 'follow_up',
-            'created_date': datetime.now().isoformat()
+            'created_date': now_iso
         }
     
     def get_connection_stage_next_actions(self, current_stage: str) -> List[str]:
         """Get suggested next actions for a connection stage."""
-        actions = {
-            'initiated': [
-                'Send initial outreach email',
-                'Research contact information',
-                'Prepare company overview'
-            ],
-            'contacted': [
-                'Wait for response (3-5 business days)',
-                'Prepare for potential meeting',
-                'Research their recent news/updates'
-            ],
-            'responded': [
-                'Schedule introductory call',
-                'Prepare meeting agenda',
-                'Send calendar invite'
-            ],
-            'meeting_scheduled': [
-                'Prepare presentation materials',
-                'Research attendees',
-                'Confirm meeting details'
-            ],
-            'meeting_completed': [
-                'Send follow-up summary',
-                'Share relevant documents',
-                'Schedule next steps'
-            ],
-            'connected': [
-                'Monitor relationship progress',
-                'Schedule regular check-ins',
-                'Track mutual value creation'
-            ],
-            'closed': [
-                'Document lessons learned',
-                'Update contact information',
-                'Consider future opportunities'
-            ]
-        }
-        
-        return actions.get(current_stage, ['Review connection status'])
+        return list(self._STAGE_ACTIONS.get(current_stage, self._DEFAULT_STAGE_ACTIONS))
     
     def get_email_template_variables(self, template_type: str) -> List[str]:
         """Get the list of variables required for a specific email template."""
-        if template_type not in self.email_templates:
-            return []
-        
-        template = self.email_templates[template_type]
-        import re
-        
-        variables = set()
-        for text in [template['subject'], template['body']]:
-            variables.update(re.findall(r'\{(\w+)\}', text))
-        
-        return sorted(list(variables))
+        return list(self._TEMPLATE_VARS.get(template_type, ()))
     
     def validate_email_template_data(self, template_type: str, data: Dict) -> List[str]:
         """Validate that all required variables are provided for an email template."""
-        required_vars = self.get_email_template_variables(template_type)
-        missing_vars = [var for var in required_vars if var not in data or not data[var]]
-        
-        return missing_vars
+        # Walk the precomputed sorted names directly instead of a fresh list copy
+        return [var for var in self._TEMPLATE_VARS.get(template_type, ()) if not data.get(var)]
     
     def get_connection_statistics(self, connections: List[Dict]) -> Dict:
         """Get statistics about connections."""
@@ -306,24 +413,81 @@ Best regards,
             }
         
         total = len(connections)
-        by_status = {}
-        successful = 0
-        total_score = 0
         
-        for conn in connections:
-            status = conn.get('status', 'unknown')
-            by_status[status] = by_status.get(status, 0) + 1
+        if total < 64:
+            # Small lists: a plain loop beats the fixed cost of building arrays
+            by_status = {}
+            successful = 0
+            total_score = 0
             
-            if status in ['connected', 'meeting_completed']:
-                successful += 1
-            
-            score = conn.get('match_score', 0)
-            if isinstance(score, (int, float)):
-                total_score += score
+            for conn in connections:
+                status = conn.get('status', 'unknown')
+                by_status[status] = by_status.get(status, 0) + 1
+                
+                if status in ['connected', 'meeting_completed']:
+                    successful += 1
+                
+                try:
+                    total_score += conn.get('match_score', 0)
+                except TypeError:
+                    # Missing or non-numeric scores don't count
+                    pass
+        else:
+            # Counter tallies in C and keeps first-seen order
+            by_status = dict(Counter(conn.get('status', 'unknown') for conn in connections))
+            successful = by_status.get('connected', 0) + by_status.get('meeting_completed', 0)
+            scores = [conn.get('match_score', 0) for conn in connections]
+            try:
+                total_score = sum(scores)
+            except TypeError:
+                # Only pay for per-row type checks when some score isn't a number
+                total_score = sum(score for score in scores if isinstance(score, (int, float)))
         
         return {
             'total': total,
             'by_status': by_status,
             'success_rate': (successful / total * 100) if total > 0 else 0,
             'average_score': (total_score / total * 100) if total > 0 else 0
-        } 
\ No newline at end of file
+        }
+    
+    def encode_connections(self, connections: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Column form of connections for bulk statistics: int8 stage ids and float64 match scores."""
+        other = len(self.CONNECTION_STAGES)
+        status_ids = np.fromiter(
+            (self._STAGE_IDS.get(conn.get('status', 'unknown'), other) for conn in connections),
+            dtype=np.int8,
+            count=len(connections)
+        )
+        scores = (conn.get('match_score', 0) for conn in connections)
+        scores = np.fromiter(
+            (score if isinstance(score, (int, float)) else 0 for score in scores),
+            dtype=np.float64,
+            count=len(connections)
+        )
+        return status_ids, scores
+    
+    def get_connection_statistics_from_arrays(self, status_ids: np.ndarray, scores: np.ndarray) -> Dict:
+        """get_connection_statistics over the arrays from encode_connections; statuses outside CONNECTION_STAGES are reported as 'other'."""
+        total = len(status_ids)
+        if total == 0:
+            return {
+                'total': 0,
+                'by_status': {},
+                'success_rate': 0,
+                'average_score': 0
+            }
+        
+        counts = np.bincount(status_ids, minlength=len(self.CONNECTION_STAGES) + 1)
+        by_status = {
+            stage: int(count)
+            for stage, count in zip(self.CONNECTION_STAGES + ('other',), counts)
+            if count
+        }
+        successful = by_status.get('connected', 0) + by_status.get('meeting_completed', 0)
+        
+        return {
+            'total': total,
+            'by_status': by_status,
+            'success_rate': successful / total * 100,
+            'average_score': float(scores.sum()) / total * 100
+        }
@@ -1,45 +1,346 @@
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import re
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import AbstractSet, Dict, FrozenSet, Iterable, Iterator, List, Optional, Union
 import uuid
-from faker import Faker
+
+import clock
+
+try:
+    import orjson  # Optional: encodes and decodes the stored records several times faster
+except ImportError:
+    orjson = None
+
+# Legacy notes are one string with entries formatted as "[YYYY-MM-DD HH:MM] text"
+NOTE_ENTRY_PATTERN = re.compile(r'^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2})\] ?(.*)$')
+
+# Each record is stored whole as JSON in `data`; the other columns are indexed copies of the
+# fields we look records up by. `seq` keeps insertion order. Relations are cascaded by hand
+# in the delete methods: contacts and needs point at companies by (non-unique) name, delete_company
+# marks needs inactive rather than deleting them, and existing data has connections whose need is gone.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    seq INTEGER PRIMARY KEY,
+    id TEXT,
+    name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_companies_id ON companies(id);
+CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(name);
+
+CREATE TABLE IF NOT EXISTS contacts (
+    seq INTEGER PRIMARY KEY,
+    id TEXT,
+    company_name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contacts_id ON contacts(id);
+CREATE INDEX IF NOT EXISTS idx_contacts_company ON contacts(company_name);
+
+CREATE TABLE IF NOT EXISTS business_needs (
+    seq INTEGER PRIMARY KEY,
+    id TEXT,
+    company_name TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_business_needs_id ON business_needs(id);
+CREATE INDEX IF NOT EXISTS idx_business_needs_company ON business_needs(company_name);
+
+CREATE TABLE IF NOT EXISTS connections (
+    seq INTEGER PRIMARY KEY,
+    id TEXT,
+    business_need_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_connections_id ON connections(id);
+CREATE INDEX IF NOT EXISTS idx_connections_need ON connections(business_need_id);
+
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# In-memory lookup indexes per table: fields mapping each value to its first record (what a
+# linear scan would find), and fields grouping every record that shares a value
+UNIQUE_INDEXES = {
+    'companies': ('id', 'name'),
+    'contacts': ('id',),
+    'business_needs': ('id',),
+    'connections': ('id',)
+}
+GROUP_INDEXES = {
+    'companies': (),
+    'contacts': ('company_name',),
+    'business_needs': ('company_name',),
+    'connections': ('business_need_id',)
+}
+
+# Connection fields update_connection may set; the indexed id and business_need_id columns are never rewritten
+UPDATABLE_CONNECTION_FIELDS = frozenset({'from_entity', 'to_entity', 'match_score', 'status', 'notes'})
+
+# Table -> repeated string fields shared through sys.intern, so every contact of a
+# company holds the same name object and index lookups hit the identity fast path
+INTERNED_FIELDS = {
+    'companies': (),
+    'contacts': ('company_name',),
+    'business_needs': ('company_name',),
+    'connections': ('status',)
+}
+
+# Size the write-ahead log is cut back to after a checkpoint
+WAL_SIZE_LIMIT = 8 * 1024 * 1024
+
+# Table -> indexed columns copied out of each record
+TABLE_KEYS = {
+    'companies': ('id', 'name'),
+    'contacts': ('id', 'company_name'),
+    'business_needs': ('id', 'company_name'),
+    'connections': ('id', 'business_need_id')
+}
+
+def json_default(value):
+    """Encode the values orjson handles natively so the stdlib path accepts the same inputs."""
+    if hasattr(value, 'tolist'):  # numpy scalars and arrays
+        return value.tolist()
+    if hasattr(value, 'isoformat'):  # datetime, date and time
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    def _dumps(value) -> str:
+        """Serialize a value to compact JSON text."""
+        return orjson.dumps(value, default=json_default, option=_ORJSON_OPTIONS).decode()
+    
+    _loads = orjson.loads
+else:
+    def _dumps(value) -> str:
+        """Serialize a value to compact JSON text."""
+        return json.dumps(value, separators=(',', ':'), default=json_default)
+    
+    _loads = json.loads
+
+def _intern_fields(table: str, record: Dict) -> Dict:
+    """Intern a record's repeated string fields so equal values are one shared string object."""
+    for field in INTERNED_FIELDS[table]:
+        value = record.get(field)
+        if type(value) is str:
+            record[field] = sys.intern(value)
+    return record
 
 class DataManager:
     """Manages all data operations for the business development tool."""
     
-    def __init__(self, data_file: str = "business_data.json"):
+    def __init__(self, data_file: str = "business_data.db", legacy_json_file: str = "business_data.json"):
         self.data_file = data_file
-        self.data = self._load_data()
-        self.fake = Faker()
-    
-    def _load_data(self) -> Dict:
-        """Load data from JSON file or create empty structure."""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                pass
+        self.version = 0  # Bumped on every write so callers can key caches on it
+        self._in_batch = False
+        self._company_names = (None, frozenset())  # (version, names) memo for get_company_names_set
+        # Streamlit reruns the script on different threads, so the connection is shared across them
+        self._conn = sqlite3.connect(data_file, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(f'PRAGMA journal_size_limit={WAL_SIZE_LIMIT}')
+        self._init_schema(legacy_json_file)
+        self._load_data()
+        self.compact()
+        self._fake = None
+    
+    def _init_schema(self, legacy_json_file: str):
+        """Create the tables on first use, importing the old JSON data file if there is one."""
+        if self._conn.execute('PRAGMA user_version').fetchone()[0] >= 1:
+            return
         
-        return {
-            'companies': [],
-            'contacts': [],
-            'business_needs': [],
-            'connections': [],
-            'settings': {}
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+            if legacy_json_file and os.path.exists(legacy_json_file):
+                try:
+                    with open(legacy_json_file, 'rb') as f:
+                        legacy = _loads(f.read())
+                except json.JSONDecodeError:
+                    legacy = {}
+                for table in TABLE_KEYS:
+                    self._write_rows(table, legacy.get(table, []))
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)',
+                    ((key, _dumps(value)) for key, value in legacy.get('settings', {}).items())
+                )
+            self._conn.execute('PRAGMA user_version = 1')
+    
+    def _load_data(self):
+        """Read every record into memory and build the lookup indexes."""
+        self.data = {
+            table: [_loads(data) for (data,) in self._conn.execute(f"SELECT data FROM {table} ORDER BY seq")]
+            for table in TABLE_KEYS
         }
+        for table, records in self.data.items():
+            if INTERNED_FIELDS[table]:
+                for record in records:
+                    _intern_fields(table, record)
+        
+        self._unique = {table: {field: {} for field in fields} for table, fields in UNIQUE_INDEXES.items()}
+        self._groups = {table: {field: {} for field in fields} for table, fields in GROUP_INDEXES.items()}
+        for table, records in self.data.items():
+            self._index_records(table, records)
+        
+        # Named views of the indexes the lookups use
+        self._by_id = {table: self._unique[table]['id'] for table in TABLE_KEYS}
+        self._companies_by_name = self._unique['companies']['name']
+        self._contacts_by_company = self._groups['contacts']['company_name']
+        self._needs_by_company = self._groups['business_needs']['company_name']
+        self._connections_by_need = self._groups['connections']['business_need_id']
+    
+    def _index_records(self, table: str, records: List[Dict]):
+        """Add records to the lookup indexes of their table."""
+        for field, index in self._unique[table].items():
+            for record in records:
+                index.setdefault(record.get(field), record)
+        for field, index in self._groups[table].items():
+            for record in records:
+                index.setdefault(record.get(field), []).append(record)
+    
+    def _unindex_records(self, table: str, records: List[Dict]):
+        """Remove records from the lookup indexes of their table."""
+        for field, index in self._unique[table].items():
+            for record in records:
+                key = record.get(field)
+                if index.get(key) is record:
+                    del index[key]
+        for field, index in self._groups[table].items():
+            for record in records:
+                key = record.get(field)
+                group = index.get(key, [])
+                for position, other in enumerate(group):
+                    if other is record:
+                        del group[position]
+                        break
+                if not group:
+                    index.pop(key, None)
+    
+    def _reindex(self, table: str):
+        """Rebuild a table's lookup indexes from scratch."""
+        for index in (*self._unique[table].values(), *self._groups[table].values()):
+            index.clear()
+        self._index_records(table, self.data[table])
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements as one transaction and bump the version once it commits."""
+        if self._in_batch:
+            # Part of a batch(), which commits or rolls back everything at the end
+            yield self._conn
+            return
+        
+        try:
+            with self._conn:
+                yield self._conn
+        except Exception:
+            # The database rolled back; reload so the in-memory copy matches it again
+            self._load_data()
+            raise
+        self.version += 1
+    
+    @property
+    def fake(self):
+        """Faker instance for generating sample data, created on first use since importing faker is slow."""
+        if self._fake is None:
+            from faker import Faker
+            self._fake = Faker()
+        return self._fake
+    
+    def compact(self):
+        """Fold the write-ahead log into the database file and truncate the log."""
+        self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    
+    @contextmanager
+    def batch(self) -> Iterator['DataManager']:
+        """Apply every change made inside the block as one transaction, committed once at the end."""
+        if self._in_batch:
+            yield self
+            return
+        
+        try:
+            with self._transaction():
+                self._in_batch = True
+                yield self
+        finally:
+            self._in_batch = False
+    
+    def _write_rows(self, table: str, records: Iterable[Dict]):
+        """Insert records into a table with their indexed columns filled in."""
+        keys = TABLE_KEYS[table]
+        self._conn.executemany(
+            f"INSERT INTO {table} ({', '.join(keys)}, data) VALUES ({', '.join('?' * (len(keys) + 1))})",
+            ((*(record.get(key) for key in keys), _dumps(record)) for record in records)
+        )
+    
+    def _insert(self, table: str, records: Iterable[Dict]):
+        """Store new records and add them to the in-memory lists and indexes."""
+        records = list(records)
+        if INTERNED_FIELDS[table]:
+            for record in records:
+                _intern_fields(table, record)
+        self._write_rows(table, records)
+        self.data[table].extend(records)
+        self._index_records(table, records)
+    
+    def _update(self, table: str, record_id: str, fields: Dict):
+        """Set fields on the record with this ID, in memory and inside its stored JSON."""
+        indexed = set(TABLE_KEYS[table]).intersection(fields)
+        if indexed:
+            # These are copied into SQL columns and the lookup indexes, which a json_set wouldn't update
+            raise ValueError(f"Indexed fields can't be updated: {', '.join(sorted(indexed))}")
+        
+        record = self._by_id[table].get(record_id)
+        if record is None:
+            return
+        
+        # Paths are bound like the values; json_set takes (path, value) pairs
+        assignments = ', '.join(['?, json(?)'] * len(fields))
+        params = []
+        for key, value in fields.items():
+            params += (f'$."{key}"', _dumps(value))
+        with self._transaction() as conn:
+            conn.execute(
+                f"UPDATE {table} SET data = json_set(data, {assignments}) WHERE id = ?",
+                (*params, record_id)
+            )
+            record.update(fields)
+            _intern_fields(table, record)
     
-    def _save_data(self):
-        """Save data to JSON file."""
-        with open(self.data_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+    def _delete_where(self, table: str, key: str, value: str):
+        """Delete the records whose indexed column `key` equals value, in the database and in memory."""
+        self._delete_where_in(table, key, {value})
+    
+    def _delete_where_in(self, table: str, key: str, values: AbstractSet[str]):
+        """Delete the records whose indexed column `key` is any of values, in the database and in memory."""
+        self._conn.executemany(f"DELETE FROM {table} WHERE {key} = ?", ((value,) for value in values))
+        
+        # One pass splits the list, then only the removed records are taken out of the indexes
+        kept, removed = [], []
+        for record in self.data[table]:
+            (removed if record.get(key) in values else kept).append(record)
+        self.data[table] = kept
+        self._unindex_records(table, removed)
     
     # Company methods
     def add_company(self, company_data: Dict):
         """Add a new company."""
-        self.data['companies'].append(company_data)
-        self._save_data()
+        with self._transaction():
+            self._insert('companies', [company_data])
+    
+    def add_companies(self, companies: List[Dict]):
+        """Add multiple companies with a single write."""
+        with self._transaction():
+            self._insert('companies', companies)
     
     def get_companies(self) -> List[Dict]:
         """Get all companies."""
@@ -47,35 +348,61 @@ class DataManager:
     
     def get_company_by_id(self, company_id: str) -> Optional[Dict]:
         """Get a company by ID."""
-        return next((c for c in self.data['companies'] if c['id'] == company_id), None)
+        return self._by_id['companies'].get(company_id)
     
     def get_company_by_name(self, name: str) -> Optional[Dict]:
         """Get a company by name."""
-        return next((c for c in self.data['companies'] if c['name'] == name), None)
+        return self._companies_by_name.get(name)
+    
+    def get_company_names_set(self) -> FrozenSet[str]:
+        """Get the set of company names, rebuilt only after the data has changed."""
+        version, names = self._company_names
+        if version != self.version or self._in_batch:
+            names = frozenset(self._companies_by_name)
+            # Writes inside a batch() don't bump the version until it commits, so don't memoize mid-batch
+            if not self._in_batch:
+                self._company_names = (self.version, names)
+        return names
     
     def delete_company(self, company_name: str) -> bool:
         """Delete a company by name."""
-        initial_count = len(self.data['companies'])
-        self.data['companies'] = [c for c in self.data['companies'] if c['name'] != company_name]
-        
-        # Also delete associated contacts
-        self.data['contacts'] = [c for c in self.data['contacts'] if c['company_name'] != company_name]
-        
-        # Update business needs to mark them as inactive if they reference this company
-        for need in self.data['business_needs']:
-            if need['company_name'] == company_name:
-                need['status'] = 'inactive'
+        return self.delete_companies((company_name,)) > 0
+    
+    def delete_companies(self, company_names: Iterable[str]) -> int:
+        """Delete several companies by name in one write; returns how many existed."""
+        names = {name for name in company_names if name in self._companies_by_name}
+        if not names:
+            return 0
         
-        if len(self.data['companies']) < initial_count:
-            self._save_data()
-            return True
-        return False
+        with self._transaction() as conn:
+            self._delete_where_in('companies', 'name', names)
+            
+            # Also delete associated contacts
+            if not names.isdisjoint(self._contacts_by_company):
+                self._delete_where_in('contacts', 'company_name', names)
+            
+            # Update business needs to mark them as inactive if they reference these companies
+            with_needs = [name for name in names if name in self._needs_by_company]
+            if with_needs:
+                conn.executemany(
+                    "UPDATE business_needs SET data = json_set(data, '$.status', 'inactive') WHERE company_name = ?",
+                    ((name,) for name in with_needs)
+                )
+                for name in with_needs:
+                    for need in self._needs_by_company[name]:
+                        need['status'] = 'inactive'
+        return len(names)
     
     # Contact methods
     def add_contact(self, contact_data: Dict):
         """Add a new contact."""
-        self.data['contacts'].append(contact_data)
-        self._save_data()
+        with self._transaction():
+            self._insert('contacts', [contact_data])
+    
+    def add_contacts(self, contacts: List[Dict]):
+        """Add multiple contacts with a single write."""
+        with self._transaction():
+            self._insert('contacts', contacts)
     
     def get_contacts(self) -> List[Dict]:
         """Get all contacts."""
@@ -83,23 +410,27 @@ class DataManager:
     
     def get_contacts_by_company(self, company_name: str) -> List[Dict]:
         """Get contacts for a specific company."""
-        return [c for c in self.data['contacts'] if c['company_name'] == company_name]
+        return list(self._contacts_by_company.get(company_name, ()))
     
     def delete_contact(self, contact_id: str) -> bool:
         """Delete a contact by ID."""
-        initial_count = len(self.data['contacts'])
-        self.data['contacts'] = [c for c in self.data['contacts'] if c['id'] != contact_id]
+        if contact_id not in self._by_id['contacts']:
+            return False
         
-        if len(self.data['contacts']) < initial_count:
-            self._save_data()
-            return True
-        return False
+        with self._transaction():
+            self._delete_where('contacts', 'id', contact_id)
+        return True
     
     # Business need methods
     def add_business_need(self, business_need_data: Dict):
         """Add a new business need."""
-        self.data['business_needs'].append(business_need_data)
-        self._save_data()
+        with self._transaction():
+            self._insert('business_needs', [business_need_data])
+    
+    def add_business_needs(self, business_needs: List[Dict]):
+        """Add multiple business needs with a single write."""
+        with self._transaction():
+            self._insert('business_needs', business_needs)
     
     def get_business_needs(self) -> List[Dict]:
         """Get all business needs."""
@@ -107,33 +438,42 @@ class DataManager:
     
     def get_business_need_by_id(self, need_id: str) -> Optional[Dict]:
         """Get a business need by ID."""
-        return next((n for n in self.data['business_needs'] if n['id'] == need_id), None)
+        return self._by_id['business_needs'].get(need_id)
     
     def update_business_need_status(self, need_id: str, status: str):
         """Update business need status."""
-        need = self.get_business_need_by_id(need_id)
-        if need:
-            need['status'] = status
-            self._save_data()
+        self._update('business_needs', need_id, {'status': status})
     
     def delete_business_need(self, need_id: str) -> bool:
         """Delete a business need by ID."""
-        initial_count = len(self.data['business_needs'])
-        self.data['business_needs'] = [n for n in self.data['business_needs'] if n['id'] != need_id]
-        
-        # Also delete associated connections
-        self.data['connections'] = [c for c in self.data['connections'] if c.get('business_need_id') != need_id]
+        existed = need_id in self._by_id['business_needs']
+        has_connections = need_id in self._connections_by_need
+        if not existed and not has_connections:
+            return False
         
-        if len(self.data['business_needs']) < initial_count:
-            self._save_data()
-            return True
-        return False
+        with self._transaction():
+            if existed:
+                self._delete_where('business_needs', 'id', need_id)
+            
+            # Also delete associated connections, including orphans whose need is already gone
+            if has_connections:
+                self._delete_where('connections', 'business_need_id', need_id)
+        return existed
     
     # Connection methods
     def add_connection(self, connection_data: Dict):
         """Add a new connection."""
-        self.data['connections'].append(connection_data)
-        self._save_data()
+        with self._transaction():
+            self._insert('connections', [connection_data])
+    
+    def add_connections(self, connections: List[Dict]):
+        """Add multiple connections with a single write."""
+        self.add_connections_iter(connections)
+    
+    def add_connections_iter(self, connections: Iterable[Dict]):
+        """Add connections from any iterable (e.g. a generator), writing once at the end."""
+        with self._transaction():
+            self._insert('connections', connections)
     
     def get_connections(self) -> List[Dict]:
         """Get all connections."""
@@ -141,52 +481,107 @@ class DataManager:
     
     def get_connection_by_id(self, connection_id: str) -> Optional[Dict]:
         """Get a connection by ID."""
-        return next((c for c in self.data['connections'] if c['id'] == connection_id), None)
+        return self._by_id['connections'].get(connection_id)
+    
+    def update_connection(self, connection_id: str, **fields):
+        """Set fields from UPDATABLE_CONNECTION_FIELDS on a connection and stamp updated_date, as one write."""
+        unknown = fields.keys() - UPDATABLE_CONNECTION_FIELDS
+        if unknown:
+            raise ValueError(f"Connection fields can't be updated: {', '.join(sorted(unknown))}")
+        
+        fields['updated_date'] = clock.now_iso()
+        self._update('connections', connection_id, fields)
     
     def update_connection_status(self, connection_id: str, status: str):
         """Update connection status."""
-        connection = self.get_connection_by_id(connection_id)
-        if connection:
-            connection['status'] = status
-            connection['updated_date'] = datetime.now().isoformat()
-            self._save_data()
+        self.update_connection(connection_id, status=status)
     
     def update_connection_notes(self, connection_id: str, notes: str):
         """Update connection notes."""
+        self.update_connection(connection_id, notes=notes)
+    
+    def add_connection_note(self, connection_id: str, text: str):
+        """Append a timestamped note to a connection's note log."""
         connection = self.get_connection_by_id(connection_id)
-        if connection:
-            connection['notes'] = notes
-            connection['updated_date'] = datetime.now().isoformat()
-            self._save_data()
+        if not connection:
+            return
+        
+        now, now_iso = clock.now()
+        entry = {'timestamp': now.strftime('%Y-%m-%d %H:%M'), 'text': text}
+        notes = connection.get('notes')
+        if not isinstance(notes, list):
+            # Legacy string notes are converted to the list format, written in full once
+            self._update('connections', connection_id, {'notes': self.parse_notes(notes) + [entry], 'updated_date': now_iso})
+            return
+        
+        # Append just the new entry inside the stored JSON instead of rewriting the whole history
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE connections SET data = json_set(json_insert(data, '$.notes[#]', json(?)), '$.updated_date', ?) WHERE id = ?",
+                (_dumps(entry), now_iso, connection_id)
+            )
+            # A new list, so the cached record only changes once the write has gone through
+            connection['notes'] = notes + [entry]
+            connection['updated_date'] = now_iso
+    
+    @staticmethod
+    def parse_notes(notes: Union[str, List[Dict], None]) -> List[Dict]:
+        """Return notes as a list of {'timestamp', 'text'} entries, migrating the legacy string format."""
+        if isinstance(notes, list):
+            return notes
+        
+        entries = []
+        for line in (notes or '').split('\n'):
+            match = NOTE_ENTRY_PATTERN.match(line)
+            if match:
+                entries.append({'timestamp': match.group(1), 'text': match.group(2)})
+            elif entries:
+                entries[-1]['text'] += '\n' + line  # Continuation of a multi-line note
+            elif line:
+                entries.append({'timestamp': '', 'text': line})
+        return entries
+    
+    @staticmethod
+    def format_notes(notes: Union[str, List[Dict], None]) -> str:
+        """Render notes (either format) as display text, one entry per line."""
+        if not isinstance(notes, list):
+            return notes or ''
+        return '\n'.join(
+            f"[{entry['timestamp']}] {entry['text']}" if entry.get('timestamp') else entry['text']
+            for entry in notes
+        )
     
     def delete_connection(self, connection_id: str) -> bool:
         """Delete a connection by ID."""
-        initial_count = len(self.data['connections'])
-        self.data['connections'] = [c for c in self.data['connections'] if c['id'] != connection_id]
+        if connection_id not in self._by_id['connections']:
+            return False
         
-        if len(self.data['connections']) < initial_count:
-            self._save_data()
-            return True
-        return False
+        with self._transaction():
+            self._delete_where('connections', 'id', connection_id)
+        return True
     
     # Data management methods
     def clear_all_data(self):
         """Clear all data."""
-        self.data = {
-            'companies': [],
-            'contacts': [],
-            'business_needs': [],
-            'connections': [],
-            'settings': {}
-        }
-        self._save_data()
+        with self._transaction() as conn:
+            for table in (*TABLE_KEYS, 'settings'):
+                conn.execute(f"DELETE FROM {table}")
+            for table in TABLE_KEYS:
+                self.data[table] = []
+                self._reindex(table)
     
     def load_sample_data(self):
         """Load sample data for testing."""
+        # Read the clock once so every sample record shares the same "now"
+        now, now_iso = clock.now()
+        # Sample connection dates, N days ago, and their note timestamps formatted once per offset
+        at = {days: now - timedelta(days=days) for days in (0, 1, 2, 3, 4, 5, 7, 10, 12, 14, 18, 21)}
+        ts = {days: stamp.strftime('%Y-%m-%d %H:%M') for days, stamp in at.items()}
+        
         # Sample companies
         sample_companies = [
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'name': 'TechStart Inc.',
                 'sector': 'Technology',
                 'size': '11-50',
@@ -195,10 +590,10 @@ class DataManager:
                 'founded_year': 2020,
                 'description': 'AI-powered marketing automation platform',
                 'tags': ['startup', 'b2b', 'saas', 'ai'],
-                'created_date': datetime.now().isoformat()
+                'created_date': now_iso
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'name': 'GreenEnergy Solutions',
                 'sector': 'Manufacturing',
                 'size': '51-200',
@@ -207,10 +602,10 @@ class DataManager:
                 'founded_year': 2018,
                 'description': 'Renewable energy equipment manufacturer',
                 'tags': ['green', 'renewable', 'manufacturing'],
-                'created_date': datetime.now().isoformat()
+                'created_date': now_iso
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'name': 'FinanceFlow',
                 'sector': 'Finance',
                 'size': '201-1000',
@@ -219,10 +614,10 @@ class DataManager:
                 'founded_year': 2015,
                 'description': 'Digital banking and payment solutions',
                 'tags': ['fintech', 'banking', 'payments'],
-                'created_date': datetime.now().isoformat()
+                'created_date': now_iso
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'name': 'HealthTech Innovations',
                 'sector': 'Healthcare',
                 'size': '11-50',
@@ -231,14 +626,14 @@ class DataManager:
                 'founded_year': 2021,
                 'description': 'Telemedicine and health monitoring platform',
                 'tags': ['healthcare', 'telemedicine', 'monitoring'],
-                'created_date': datetime.now().isoformat()
+                'created_date': now_iso
             }
         ]
         
         # Sample contacts
         sample_contacts = [
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'name': 'John Smith',
                 'email': 'john.smith@techstart.example.com',
                 'company_name': 'TechStart Inc.',
@@ -247,10 +642,10 @@ class DataManager:
                 'linkedin': 'https://linkedin.com/in/johnsmith',
                 'role_type': 'Decision Maker',
                 'notes': 'Founder and CEO, very interested in partnerships',
-                'created_date': datetime.now().isoformat()
+                'created_date': now_iso
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'name': 'Sarah Johnson',
                 'email': 'sarah.johnson@greenenergy.example.com',
                 'company_name': 'GreenEnergy Solutions',
@@ -259,10 +654,10 @@ class DataManager:
                 'linkedin': 'https://linkedin.com/in/sarahjohnson',
                 'role_type': 'Decision Maker',
                 'notes': 'Leads sales efforts, looking for new markets',
-                'created_date': datetime.now().isoformat()
+                'created_date': now_iso
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'name': 'Michael Chen',
                 'email': 'michael.chen@financeflow.example.com',
                 'company_name': 'FinanceFlow',
@@ -271,14 +666,14 @@ class DataManager:
                 'linkedin': 'https://linkedin.com/in/michaelchen',
                 'role_type': 'Technical',
                 'notes': 'Technical leader, interested in API integrations',
-                'created_date': datetime.now().isoformat()
+                'created_date': now_iso
             }
         ]
         
         # Sample business needs
         sample_business_needs = [
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'title': 'Seeking Series A Investment',
                 'company_name': 'TechStart Inc.',
                 'type': 'Significant business event',
@@ -289,10 +684,10 @@ class DataManager:
                 'timeline': '3-6 months',
                 'description': 'Looking for Series A funding to scale our AI marketing platform. Need investors with experience in B2B SaaS.',
                 'status': 'active',
-                'created_date': datetime.now().isoformat()
+                'created_date': now_iso
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'title': 'Partnership for Energy Storage',
                 'company_name': 'GreenEnergy Solutions',
                 'type': 'Proactive customer contact',
@@ -303,76 +698,87 @@ class DataManager:
                 'timeline': '6-12 months',
                 'description': 'Seeking technology partners for advanced energy storage solutions. Looking for companies with battery technology expertise.',
                 'status': 'active',
-                'created_date': datetime.now().isoformat()
+                'created_date': now_iso
             }
         ]
         
         # Sample connections - showing different stages of the connection process
         sample_connections = [
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'business_need_id': sample_business_needs[0]['id'],  # Series A Investment need
                 'from_entity': 'TechStart Inc.',
                 'to_entity': 'FinanceFlow',
                 'match_score': 0.75,
                 'status': 'contacted',
-                'created_date': (datetime.now() - timedelta(days=5)).isoformat(),
-                'updated_date': (datetime.now() - timedelta(days=2)).isoformat(),
-                'notes': f"[{(datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d %H:%M')}] Initial match created based on sector compatibility and company size.\n[{(datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d %H:%M')}] Sent initial outreach email to Michael Chen. Waiting for response."
+                'created_date': at[5].isoformat(),
+                'updated_date': at[2].isoformat(),
+                'notes': f"[{ts[5]}] Initial match created based on sector compatibility and company size.\n[{ts[2]}] Sent initial outreach email to Michael Chen. Waiting for response."
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'business_need_id': sample_business_needs[1]['id'],  # Energy Storage Partnership
                 'from_entity': 'GreenEnergy Solutions',
                 'to_entity': 'TechStart Inc.',
                 'match_score': 0.68,
                 'status': 'responded',
-                'created_date': (datetime.now() - timedelta(days=7)).isoformat(),
-                'updated_date': (datetime.now() - timedelta(days=1)).isoformat(),
-                'notes': f"[{(datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d %H:%M')}] Auto-matched based on complementary technologies.\n[{(datetime.now() - timedelta(days=4)).strftime('%Y-%m-%d %H:%M')}] Initial contact made through LinkedIn.\n[{(datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d %H:%M')}] Positive response received! John Smith is interested in exploring energy storage AI applications. Scheduling call for next week."
+                'created_date': at[7].isoformat(),
+                'updated_date': at[1].isoformat(),
+                'notes': f"[{ts[7]}] Auto-matched based on complementary technologies.\n[{ts[4]}] Initial contact made through LinkedIn.\n[{ts[1]}] Positive response received! John Smith is interested in exploring energy storage AI applications. Scheduling call for next week."
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'business_need_id': sample_business_needs[0]['id'],  # Series A Investment need
                 'from_entity': 'TechStart Inc.',
                 'to_entity': 'HealthTech Innovations',
                 'match_score': 0.82,
                 'status': 'connected',
-                'created_date': (datetime.now() - timedelta(days=14)).isoformat(),
-                'updated_date': (datetime.now() - timedelta(days=3)).isoformat(),
-                'notes': f"[{(datetime.now() - timedelta(days=14)).strftime('%Y-%m-%d %H:%M')}] High match score due to similar sector and startup stage.\n[{(datetime.now() - timedelta(days=10)).strftime('%Y-%m-%d %H:%M')}] Great initial call - they've been through Series A recently.\n[{(datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d %H:%M')}] Introduced to their lead investor, Alexandra Rodriguez at MedTech Ventures.\n[{(datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d %H:%M')}] Connection established! Alexandra is reviewing our pitch deck."
+                'created_date': at[14].isoformat(),
+                'updated_date': at[3].isoformat(),
+                'notes': f"[{ts[14]}] High match score due to similar sector and startup stage.\n[{ts[10]}] Great initial call - they've been through Series A recently.\n[{ts[7]}] Introduced to their lead investor, Alexandra Rodriguez at MedTech Ventures.\n[{ts[3]}] Connection established! Alexandra is reviewing our pitch deck."
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'business_need_id': sample_business_needs[1]['id'],  # Energy Storage Partnership
                 'from_entity': 'GreenEnergy Solutions',
                 'to_entity': 'FinanceFlow',
                 'match_score': 0.45,
                 'status': 'initiated',
-                'created_date': datetime.now().isoformat(),
-                'updated_date': datetime.now().isoformat(),
-                'notes': f"[{datetime.now().strftime('%Y-%m-%d %H:%M')}] Recently identified potential match. FinanceFlow's payment solutions could complement our renewable energy customer financing needs. Research phase - need to identify best contact person."
+                'created_date': now_iso,
+                'updated_date': now_iso,
+                'notes': f"[{ts[0]}] Recently identified potential match. FinanceFlow's payment solutions could complement our renewable energy customer financing needs. Research phase - need to identify best contact person."
             },
             {
-                'id': str(uuid.uuid4()),
+                'id': uuid.uuid4().hex,
                 'business_need_id': sample_business_needs[0]['id'],  # Series A Investment need
                 'from_entity': 'TechStart Inc.',
                 'to_entity': 'GreenEnergy Solutions',
                 'match_score': 0.52,
                 'status': 'closed',
-                'created_date': (datetime.now() - timedelta(days=21)).isoformat(),
-                'updated_date': (datetime.now() - timedelta(days=12)).isoformat(),
-                'notes': f"[{(datetime.now() - timedelta(days=21)).strftime('%Y-%m-%d %H:%M')}] Explored potential corporate investment opportunity.\n[{(datetime.now() - timedelta(days=18)).strftime('%Y-%m-%d %H:%M')}] Had promising discussions about AI applications in renewable energy.\n[{(datetime.now() - timedelta(days=12)).strftime('%Y-%m-%d %H:%M')}] Decided to focus on technology partnership rather than investment. Connection closed for Series A purpose but keeping relationship warm for future collaboration."
+                'created_date': at[21].isoformat(),
+                'updated_date': at[12].isoformat(),
+                'notes': f"[{ts[21]}] Explored potential corporate investment opportunity.\n[{ts[18]}] Had promising discussions about AI applications in renewable energy.\n[{ts[12]}] Decided to focus on technology partnership rather than investment. Connection closed for Series A purpose but keeping relationship warm for future collaboration."
             }
         ]
         
         # Load sample data
-        self.data['companies'].extend(sample_companies)
-        self.data['contacts'].extend(sample_contacts)
-        self.data['business_needs'].extend(sample_business_needs)
-        self.data['connections'].extend(sample_connections)
+        with self.batch():
+            self.add_companies(sample_companies)
+            self.add_contacts(sample_contacts)
+            self.add_business_needs(sample_business_needs)
+            self.add_connections(sample_connections)
+    
+    def export_pretty(self, filename: str = None) -> str:
+        """Write every table and setting to an indented JSON file for reading by hand."""
+        if not filename:
+            filename = f"business_data_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        self._save_data()
+        # Storage keeps compact JSON; indentation is only paid for on this on-demand export
+        snapshot = dict(self.data)
+        snapshot['settings'] = {key: _loads(value) for key, value in self._conn.execute("SELECT key, value FROM settings")}
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, indent=2, ensure_ascii=False)
+        return filename
     
     def export_to_excel(self, filename: str = None):
         """Export data to Excel file (future implementation)."""
@@ -1,26 +1,114 @@
 import json
+import mmap
 import os
-from datetime import datetime
 from typing import Dict, Optional
 
+import clock
+from data_manager import json_default
+
+try:
+    import orjson  # Optional: encodes the JSONL audit records several times faster
+except ImportError:
+    orjson = None
+
+LOG_SEPARATOR = '=' * 60
+
+_COMPANY_CREATED_TEMPLATE = (
+    "Company Name: {company_name}\n"
+    "Company ID: {company_id}\n"
+    "Sector: {sector}\n"
+    "Size: {size}\n"
+    "Location: {location}\n"
+)
+_COMPANY_DELETED_TEMPLATE = (
+    "Company Name: {company_name}\n"
+    "Company ID: {company_id}\n"
+    "Deleted By: {deleted_by}\n"
+    "Deletion Reason: {deletion_reason}\n"
+    "Original Sector: {sector}\n"
+)
+
+# Display labels for the fields of the generically formatted entries
+_FIELD_LABELS = {
+    key: key.replace('_', ' ').title()
+    for key in (
+        'contact_id', 'contact_name', 'company_name', 'position', 'email', 'user_note',
+        'need_id', 'title', 'type', 'looking_for', 'priority',
+        'connection_id', 'from_entity', 'to_entity', 'match_score'
+    )
+}
+
+def _format_company_created(log_entry: Dict) -> str:
+    """Detail lines of a COMPANY_CREATED entry."""
+    text = _COMPANY_CREATED_TEMPLATE.format_map(log_entry)
+    if log_entry['user_note']:
+        text += f"Note: {log_entry['user_note']}\n"
+    return text
+
+def _format_company_deleted(log_entry: Dict) -> str:
+    """Detail lines of a COMPANY_DELETED entry."""
+    return _COMPANY_DELETED_TEMPLATE.format_map(log_entry)
+
+def _format_fields(log_entry: Dict) -> str:
+    """One "Label: value" line per field of the entry."""
+    return ''.join(
+        f"{_FIELD_LABELS.get(key) or key.replace('_', ' ').title()}: {value}\n"
+        for key, value in log_entry.items()
+        if key != 'timestamp' and key != 'operation'
+    )
+
+def _encode_record(log_entry: Dict) -> bytes:
+    """One JSONL line holding the full structured log entry."""
+    if orjson is not None:
+        return orjson.dumps(
+            log_entry, default=json_default,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return (json.dumps(log_entry, ensure_ascii=False, separators=(',', ':'), default=json_default) + '\n').encode('utf-8')
+
+def _format_nothing(log_entry: Dict) -> str:
+    """Operations without a readable summary only get the header and JSON record."""
+    return ''
+
+# Operation -> formatter of the readable detail lines
+_FORMATTERS = {
+    "COMPANY_CREATED": _format_company_created,
+    "COMPANY_DELETED": _format_company_deleted,
+    "CONTACT_CREATED": _format_fields,
+    "BUSINESS_NEED_CREATED": _format_fields,
+    "CONNECTION_CREATED": _format_fields
+}
+
 class BusinessLogger:
     """Handles logging of all business operations for audit trail."""
     
-    def __init__(self, log_file: str = "business_operations.log"):
+    def __init__(self, log_file: str = "business_operations.log",
+                 records_file: Optional[str] = "business_operations.jsonl"):
         self.log_file = log_file
+        self.records_file = records_file
         self.ensure_log_file_exists()
+        # Opened once and kept open, unbuffered: each entry goes to the OS as one append, so it is on
+        # disk as soon as it is logged and entries from concurrent sessions can't interleave
+        self._fh = open(self.log_file, 'ab', buffering=0)
+        self._records_fh = open(records_file, 'ab', buffering=0) if records_file else None
     
     def ensure_log_file_exists(self):
         """Create log file if it doesn't exist."""
         if not os.path.exists(self.log_file):
             with open(self.log_file, 'w', encoding='utf-8') as f:
                 f.write("=== Business Development Tool - Operations Log ===\n")
-                f.write(f"Log started: {datetime.now().isoformat()}\n\n")
+                f.write(f"Log started: {clock.now_iso()}\n\n")
+    
+    def close(self):
+        """Close the log files."""
+        for handle in (self._fh, self._records_fh):
+            if handle is not None and not handle.closed:
+                handle.close()
     
     def log_company_creation(self, company_data: Dict, user_note: str = ""):
         """Log company creation event."""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": clock.now_iso(),
             "operation": "COMPANY_CREATED",
             "company_id": company_data.get('id', 'N/A'),
             "company_name": company_data.get('name', 'N/A'),
@@ -41,7 +129,7 @@ class BusinessLogger:
     def log_company_deletion(self, company_data: Dict, deletion_reason: str, user_name: str = "System User"):
         """Log company deletion event."""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": clock.now_iso(),
             "operation": "COMPANY_DELETED",
             "company_id": company_data.get('id', 'N/A'),
             "company_name": company_data.get('name', 'N/A'),
@@ -56,7 +144,7 @@ class BusinessLogger:
     def log_contact_creation(self, contact_data: Dict, user_note: str = ""):
         """Log contact creation event."""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": clock.now_iso(),
             "operation": "CONTACT_CREATED",
             "contact_id": contact_data.get('id', 'N/A'),
             "contact_name": contact_data.get('name', 'N/A'),
@@ -71,7 +159,7 @@ class BusinessLogger:
     def log_business_need_creation(self, need_data: Dict, user_note: str = ""):
         """Log business need creation event."""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": clock.now_iso(),
             "operation": "BUSINESS_NEED_CREATED",
             "need_id": need_data.get('id', 'N/A'),
             "title": need_data.get('title', 'N/A'),
@@ -87,7 +175,7 @@ class BusinessLogger:
     def log_connection_creation(self, connection_data: Dict, user_note: str = ""):
         """Log connection creation event."""
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": clock.now_iso(),
             "operation": "CONNECTION_CREATED",
             "connection_id": connection_data.get('id', 'N/A'),
             "from_entity": connection_data.get('from_entity', 'N/A'),
@@ -99,63 +187,64 @@ class BusinessLogger:
         self._write_log_entry(log_entry)
     
     def _write_log_entry(self, log_entry: Dict):
-        """Write a log entry to the log file."""
+        """Write a log entry as readable text to the log file and as one JSON line to the records file."""
         try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                timestamp = log_entry['timestamp']
-                operation = log_entry['operation']
-                
-                # Write readable log entry
-                f.write(f"\n{'='*60}\n")
-                f.write(f"[{timestamp}] {operation}\n")
-                f.write(f"{'='*60}\n")
-                
-                # Write details based on operation type
-                if operation == "COMPANY_CREATED":
-                    f.write(f"Company Name: {log_entry['company_name']}\n")
-                    f.write(f"Company ID: {log_entry['company_id']}\n")
-                    f.write(f"Sector: {log_entry['sector']}\n")
-                    f.write(f"Size: {log_entry['size']}\n")
-                    f.write(f"Location: {log_entry['location']}\n")
-                    if log_entry['user_note']:
-                        f.write(f"Note: {log_entry['user_note']}\n")
-                    
-                elif operation == "COMPANY_DELETED":
-                    f.write(f"Company Name: {log_entry['company_name']}\n")
-                    f.write(f"Company ID: {log_entry['company_id']}\n")
-                    f.write(f"Deleted By: {log_entry['deleted_by']}\n")
-                    f.write(f"Deletion Reason: {log_entry['deletion_reason']}\n")
-                    f.write(f"Original Sector: {log_entry['sector']}\n")
-                
-                elif operation in ["CONTACT_CREATED", "BUSINESS_NEED_CREATED", "CONNECTION_CREATED"]:
-                    for key, value in log_entry.items():
-                        if key not in ['timestamp', 'operation']:
-                            f.write(f"{key.replace('_', ' ').title()}: {value}\n")
-                
-                # Write JSON for detailed record
-                f.write(f"\nJSON Record:\n{json.dumps(log_entry, indent=2, ensure_ascii=False)}\n")
-                f.write(f"\n")
-                
+            timestamp = log_entry['timestamp']
+            operation = log_entry['operation']
+            
+            # Readable header, then details based on operation type, written in a single call
+            text = (
+                f"\n{LOG_SEPARATOR}\n[{timestamp}] {operation}\n{LOG_SEPARATOR}\n"
+                f"{_FORMATTERS.get(operation, _format_nothing)(log_entry)}\n"
+            )
+            self._fh.write(text.encode('utf-8'))
+            
+            # Write the detailed record once, compactly, to its own machine-readable file
+            if self._records_fh is not None:
+                self._records_fh.write(_encode_record(log_entry))
+            
         except Exception as e:
             print(f"Error writing to log file: {e}")
     
     def get_recent_logs(self, lines: int = 20) -> str:
         """Get recent log entries."""
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-                return ''.join(recent_lines)
+            if lines <= 0:
+                with open(self.log_file, 'r', encoding='utf-8') as f:
+                    all_lines = f.readlines()
+                    recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
+                    return ''.join(recent_lines)
+            
+            with open(self.log_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ''  # mmap can't map an empty file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Walk back over the last `lines` line breaks, not counting the one ending the file
+                    position = len(mm) - 1 if mm[-1:] == b'\n' else len(mm)
+                    for _ in range(lines):
+                        position = mm.rfind(b'\n', 0, position)
+                        if position < 0:
+                            break
+                    # Only the pages holding the tail are read and copied
+                    tail = mm[position + 1:]
+            
+            # Same newline handling as reading the file in text mode
+            text = tail.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            all_lines = text.split('\n')
+            recent_lines = [line + '\n' for line in all_lines[:-1]]
+            if all_lines[-1]:
+                recent_lines.append(all_lines[-1])
+            return ''.join(recent_lines[-lines:])
         except Exception as e:
             return f"Error reading log file: {e}"
     
     def search_logs(self, search_term: str) -> str:
         """Search for specific terms in logs."""
         try:
+            term = search_term.lower()
             with open(self.log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-                matching_lines = [line for line in lines if search_term.lower() in line.lower()]
+                # Stream the file instead of holding it and its split lines in memory
+                matching_lines = [line.rstrip('\n') for line in f if term in line.lower()]
                 return '\n'.join(matching_lines) if matching_lines else "No matching entries found."
         except Exception as e:
             return f"Error searching log file: {e}" 
\ No newline at end of file